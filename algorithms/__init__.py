@@ -1,6 +1,17 @@
 #! /usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from . import regression
-from . import search
-from . import stats
+import importlib
+
+__all__ = ['big_o', 'regression', 'search', 'search_service', 'stats']
+
+
+def __getattr__(name):
+    """Import submodules on first access to keep package import fast."""
+    if name in __all__:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,30 +3,161 @@
 
 """ Big O Notation Module
 
+Run ``python -m algorithms.big_o`` from the repository root to plot the
+model curves.
+
 .. moduleauthor:: Timothy Helton <timothy.j.helton@gmail.com>
 """
 
-import os.path as osp
+from collections import namedtuple
+import time
+from typing import Callable, List
 
-import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
-import scipy.misc as sci_msc
+
+from . import regression
+
+
+Complexity = namedtuple('Complexity', ('model', 'slope', 'intercept',
+                                       'residual'))
+
+models = {
+    'O(1)': np.ones_like,
+    'O(log n)': np.log,
+    'O(n)': lambda n: n,
+    'O(n log n)': lambda n: n * np.log(n),
+    'O($n^2$)': np.square,
+}
+
+
+def __getattr__(name):
+    """Build the big_o model curves with pandas on first access."""
+    if name == 'big_o':
+        import pandas as pd
+        from scipy import special
+
+        n = np.linspace(0.001, 4, 1000)
+        log_n = np.log(n)
+        n_log_n = n * log_n
+        n_squared = np.square(n)
+        n_factorial = special.factorial(n)
+
+        big_o = pd.DataFrame(np.c_[n, log_n, n_log_n, n_squared, n_factorial],
+                             columns=['O(n)', 'O(log n)', 'O(n log n)',
+                                      'O($n^2$)', 'O(n!)'])
+        globals()['big_o'] = big_o
+        return big_o
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def geometric_sizes(start: int = 2 ** 8, stop: int = 2 ** 18,
+                    count: int = 11) -> np.ndarray:
+    """Input sizes evenly spaced on a logarithmic scale.
+
+    :param int start: smallest size
+    :param int stop: largest size
+    :param int count: number of sizes
+    :returns: unique integer sizes
+    :rtype: ndarray
+    """
+    return np.unique(np.geomspace(start, stop, count).astype(np.int64))
 
 
-n = np.linspace(0.001, 4, 1000)
-log_n = np.log(n)
-n_log_n = n * log_n
-n_squared = np.square(n)
-n_factorial = sci_msc.factorial(n)
+def measure(func: Callable, sizes: np.ndarray = None,
+            setup: Callable = None, number: int = 1,
+            repeat: int = 5) -> np.ndarray:
+    """Time a callable over a range of input sizes.
+
+    :param func: callable taking the argument built for each size
+    :param ndarray sizes: input sizes (default geometric_sizes())
+    :param setup: callable building the argument of func from a size \
+        outside of the timing (default passes the size itself)
+    :param int number: number of calls in each timing
+    :param int repeat: number of timings of each size, the best is kept
+    :returns: best time of one call in seconds for each size
+    :rtype: ndarray
+    """
+    sizes = geometric_sizes() if sizes is None else sizes
+    times = []
+    for size in sizes:
+        argument = setup(size) if setup else size
+        best = np.inf
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                func(argument)
+            best = min(best, time.perf_counter() - start)
+        times.append(best / number)
+    return np.array(times)
+
+
+def fit_models(sizes: np.ndarray, times: np.ndarray) -> List[Complexity]:
+    """Fit time = slope * f(n) + intercept for every model f.
+
+    :param ndarray sizes: input sizes
+    :param ndarray times: time of each size
+    :returns: fit of each model ordered from the smallest root mean square \
+        residual relative to the times
+    :rtype: list(Complexity)
+    """
+    sizes = np.asarray(sizes, dtype=np.float64)
+    times = np.asarray(times, dtype=np.float64)
+    fits = []
+    for model, f in models.items():
+        inst = regression.LeastSquares(x=f(sizes), y=times)
+        inst.fit()
+        predicted = inst.slope * inst.x + inst.y_intercept
+        residual = np.sqrt(np.mean(np.square((predicted - times) / times)))
+        fits.append(Complexity(model, inst.slope, inst.y_intercept, residual))
+    return sorted(fits, key=lambda x: x.residual)
+
+
+def select(fits: List[Complexity], tolerance: float = 0.05) -> Complexity:
+    """Select the slowest growing model that fits about as well as the best.
+
+    A model growing faster than another always fits timing noise at least
+    as well, so a model is only chosen over a slower growing one when it
+    reduces the relative residual by more than tolerance. Models other than
+    O(1) with a negative slope are ignored.
+
+    :param list fits: model fits from fit_models
+    :param float tolerance: relative residual a faster growing model must \
+        improve on
+    :returns: selected model fit
+    :rtype: Complexity
+    """
+    valid = [x for x in fits if x.model == 'O(1)' or x.slope > 0]
+    best = min(x.residual for x in valid)
+    return min((x for x in valid if x.residual <= best + tolerance),
+               key=lambda x: list(models).index(x.model))
+
+
+def estimate(func: Callable, sizes: np.ndarray = None,
+             setup: Callable = None, tolerance: float = 0.05,
+             **kwargs) -> Complexity:
+    """Estimate the complexity class of a callable from its timings.
+
+    :param func: callable taking the argument built for each size
+    :param ndarray sizes: input sizes (default geometric_sizes())
+    :param setup: callable building the argument of func from a size
+    :param float tolerance: relative residual a faster growing model must \
+        improve on
+    :param kwargs: number and repeat options passed to measure
+    :returns: best fitting model with its constants
+    :rtype: Complexity
+    """
+    sizes = geometric_sizes() if sizes is None else sizes
+    times = measure(func, sizes, setup, **kwargs)
+    return select(fit_models(sizes, times), tolerance)
 
-big_o = pd.DataFrame(np.c_[n, log_n, n_log_n, n_squared, n_factorial],
-                     columns=['O(n)', 'O(log n)', 'O(n log n)',
-                              'O($n^2$)', 'O(n!)'])
 
 if __name__ == '__main__':
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots(figsize=(10, 8), facecolor='white')
-    fig.canvas.set_window_title('Big O Notation Common Performance Models')
+    fig.canvas.manager.set_window_title(
+        'Big O Notation Common Performance Models')
+    big_o = __getattr__('big_o')
     big_o.plot(ax=ax, kind='line', style=['--', '-', '-.', ':', '-'])
     for n in range(5):
         ax.lines[n].set_linewidth(2)
@@ -37,4 +168,3 @@ if __name__ == '__main__':
     plt.grid()
 
     plt.show()
-    # plt.savefig(osp.join('..', 'big_o_models.png'))
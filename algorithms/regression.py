@@ -6,12 +6,152 @@
 .. moduleauthor:: Timothy Helton <timothy.j.helton@gmail.com>
 """
 
+from collections import deque, namedtuple
+import multiprocessing as mp
 import os.path as osp
 
-import matplotlib.pyplot as plt
 import numpy as np
-from scipy import stats
-import seaborn
+
+
+Coefficients = namedtuple('Coefficients', ('slope', 'y_intercept', 'r'))
+Intervals = namedtuple('Intervals', ('slope', 'y_intercept'))
+
+_sample = None
+
+
+class SufficientStatistics:
+    """Mergeable sufficient statistics of a least squares linear regression.
+
+    :Attributes:
+
+    - **count**: *int* number of points
+    - **mean_x**: *float* mean of the x values
+    - **mean_y**: *float* mean of the y values
+    - **removed_xx**: *float* squared x deviations subtracted by removing \
+        points
+    - **removed_yy**: *float* squared y deviations subtracted by removing \
+        points
+    - **sxx**: *float* sum of squared deviations of x from its mean
+    - **sxy**: *float* sum of products of the x and y deviations
+    - **syy**: *float* sum of squared deviations of y from its mean
+
+    :Details:
+
+    The sums of x, y, x^2, x*y and y^2 are kept about the running means
+    (Chan et al. pairwise update), which carries the same information as
+    the raw sums without their cancellation error. Chunks are absorbed in a
+    single pass each and statistics from parallel workers merge in any
+    order. Combining a negative count removes points.
+
+    Rounding in the chunk means leaves a small sum of squares instead of 0
+    for constant values, so coefficients treats x or y as constant when its
+    sum of squares is within rounding of the sum of squares about zero.
+    Removing points subtracts from the sums and can leave an error
+    proportional to what was subtracted, which is tracked in removed_xx
+    and removed_yy and widens that allowance.
+    """
+    def __init__(self):
+        self.count = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.removed_xx = 0.0
+        self.removed_yy = 0.0
+        self.sxx = 0.0
+        self.sxy = 0.0
+        self.syy = 0.0
+
+    def __repr__(self) -> str:
+        return (f'SufficientStatistics(count={self.count}, '
+                f'mean_x={self.mean_x}, mean_y={self.mean_y})')
+
+    def combine(self, count: int, mean_x: float, mean_y: float, sxx: float,
+                sxy: float, syy: float):
+        """Combine the statistics of another set of points.
+
+        :param int count: number of points
+        :param float mean_x: mean of the x values
+        :param float mean_y: mean of the y values
+        :param float sxx: sum of squared deviations of x
+        :param float sxy: sum of products of the x and y deviations
+        :param float syy: sum of squared deviations of y
+        """
+        total = self.count + count
+        if not total:
+            return
+        delta_x = mean_x - self.mean_x
+        delta_y = mean_y - self.mean_y
+        weight = self.count * count / total
+        if count < 0:
+            self.removed_xx += sxx - delta_x * delta_x * weight
+            self.removed_yy += syy - delta_y * delta_y * weight
+        self.mean_x += delta_x * count / total
+        self.mean_y += delta_y * count / total
+        self.sxx += sxx + delta_x * delta_x * weight
+        self.sxy += sxy + delta_x * delta_y * weight
+        self.syy += syy + delta_y * delta_y * weight
+        self.count = total
+
+    def update(self, x: np.ndarray, y: np.ndarray):
+        """Absorb a chunk of points.
+
+        :param ndarray x: x values
+        :param ndarray y: y values
+        """
+        x = np.asarray(x, dtype=np.float64).ravel()
+        y = np.asarray(y, dtype=np.float64).ravel()
+        if not x.size:
+            return
+        mean_x = x.mean()
+        mean_y = y.mean()
+        dx = x - mean_x
+        dy = y - mean_y
+        self.combine(x.size, mean_x, mean_y, np.dot(dx, dx), np.dot(dx, dy),
+                     np.dot(dy, dy))
+
+    def merge(self, other):
+        """Absorb the statistics of another set of points.
+
+        :param SufficientStatistics other: statistics to be merged
+        :returns: these statistics
+        :rtype: SufficientStatistics
+        """
+        self.combine(other.count, other.mean_x, other.mean_y, other.sxx,
+                     other.sxy, other.syy)
+        self.removed_xx += other.removed_xx
+        self.removed_yy += other.removed_yy
+        return self
+
+    def is_flat(self, tolerance: float = 1e-20) -> bool:
+        """Determine if x or y is constant to within rounding.
+
+        :param float tolerance: size of a sum of squared deviations, \
+            relative to the sum of squares about zero, treated as zero
+        :returns: True if x or y has zero variance
+        :rtype: bool
+        """
+        removal = 64 * np.finfo(np.float64).eps
+        limit_x = (tolerance * (self.count * self.mean_x ** 2 + self.sxx)
+                   + removal * self.removed_xx)
+        limit_y = (tolerance * (self.count * self.mean_y ** 2 + self.syy)
+                   + removal * self.removed_yy)
+        return self.sxx <= limit_x or self.syy <= limit_y
+
+    def coefficients(self) -> tuple:
+        """Calculate the regression coefficients.
+
+        As with LeastSquares.calc_slope the slope is 0 when either x or y
+        has zero variance (see is_flat), in which case r is nan.
+
+        :returns: slope, y-intercept and Pearson correlation r
+        :rtype: tuple(float, float, float)
+        """
+        if self.is_flat():
+            slope = 0
+            r = np.nan
+        else:
+            slope = self.sxy / self.sxx
+            r = self.sxy / np.sqrt(self.sxx * self.syy)
+        return slope, self.mean_y - slope * self.mean_x, r
 
 
 class LeastSquares:
@@ -22,15 +162,27 @@ class LeastSquares:
 
     :Attributes:
 
+    - **r**: *float* Pearson correlation of x and y
     - **slope**: *float* slope of regression line
+    - **statistics**: *SufficientStatistics* statistics of the points \
+        absorbed by fit, partial_fit and merge
     - **x**: *ndarray* x values
     - **y**: *ndarray* y values
     - **y_intercept**: *float* value where regression line intercepts y-axis
+
+    :Details:
+
+    fit calculates the coefficients in a single pass over x and y.
+    partial_fit absorbs streamed chunks (x and y need not be provided) and
+    merge absorbs the fit of another instance, such as one from a parallel
+    worker; both leave the coefficients of every point absorbed so far.
     """
-    def __init__(self, x: np.ndarray, y: np.ndarray):
+    def __init__(self, x: np.ndarray = None, y: np.ndarray = None):
         self.x = x
         self.y = y
+        self.r = None
         self.slope = None
+        self.statistics = SufficientStatistics()
         self.y_intercept = None
 
     def __repr__(self) -> str:
@@ -65,37 +217,461 @@ class LeastSquares:
         y_mean = np.mean(self.y)
         self.y_intercept = y_mean - self.slope * x_mean
 
+    def fit(self):
+        """Calculate the slope, y-intercept and r in one pass over the data.
+        """
+        self.statistics = SufficientStatistics()
+        self.partial_fit(self.x, self.y)
+
+    def partial_fit(self, x: np.ndarray, y: np.ndarray):
+        """Absorb a chunk of points and update the coefficients.
+
+        :param ndarray x: x values
+        :param ndarray y: y values
+        """
+        self.statistics.update(x, y)
+        self.slope, self.y_intercept, self.r = self.statistics.coefficients()
+
+    def merge(self, other):
+        """Absorb the points fitted by another instance.
+
+        :param other: fitted instance or its statistics
+        :type: LeastSquares | SufficientStatistics
+        """
+        if isinstance(other, LeastSquares):
+            other = other.statistics
+        self.statistics.merge(other)
+        self.slope, self.y_intercept, self.r = self.statistics.coefficients()
+
+    def confidence_intervals(self, **kwargs) -> Intervals:
+        """Bootstrap confidence intervals of the slope and y-intercept.
+
+        :param kwargs: options passed to bootstrap
+        :returns: (low, high) percentile interval of each coefficient
+        :rtype: Intervals
+        """
+        return bootstrap(self.x, self.y, **kwargs)
+
     def check_values(self) -> str:
         """Use SciPy to check the regression coefficients."""
+        from scipy import stats
+
         slope, intercept, r_value, p_value, std_err = stats.linregress(self.x,
                                                                        self.y)
         return ('\n\nCheck Values from SciPy\n\n'
                 f'Slope: {slope:.2}\n'
                 f'Intercept: {intercept:.2}')
 
-    def plot_data(self, save_name=None, **kwargs):
-        """Plot the data with regression line."""
-        self.calc_slope()
-        self.calc_y_intercept()
-
-        fig = plt.figure('Least Squares Linear Regression', figsize=(5, 8),
-                         facecolor='white', edgecolor='black')
-        ax = plt.subplot2grid((1, 1), (0, 0))
+    def draw(self, ax, mode: str = 'scatter', max_points: int = None,
+             gridsize: int = 100):
+        """Draw the data and regression line on a set of axes.
 
-        ax.scatter(self.x, self.y)
+        :param ax: axes to draw on
+        :param str mode: how the points are drawn, scatter (each point), \
+            hexbin or hist2d (point density in bins)
+        :param int max_points: scatter at most this many points, chosen at \
+            random (default all points)
+        :param int gridsize: number of bins along each axis for hexbin and \
+            hist2d
+        """
+        x = np.asarray(self.x)
+        y = np.asarray(self.y)
+        if mode == 'hexbin':
+            ax.hexbin(x, y, gridsize=gridsize, mincnt=1, cmap='Blues')
+        elif mode == 'hist2d':
+            ax.hist2d(x, y, bins=gridsize, cmin=1, cmap='Blues')
+        else:
+            if max_points is not None and x.size > max_points:
+                choice = np.random.RandomState(0).choice(
+                    x.size, max_points, replace=False)
+                x = x[choice]
+                y = y[choice]
+            ax.scatter(x, y)
 
         regression_x = np.linspace(np.min(self.x), np.max(self.x), 100)
         regression_y = self.slope * regression_x + self.y_intercept
         ax.plot(regression_x, regression_y, '-b',
-                label=f'Y = {self.slope:.2}X + {self.y_intercept:.2}')
+                label=(f'Y = {float(self.slope):.2}X + '
+                       f'{float(self.y_intercept):.2}'))
 
         ax.set_xlabel('X')
         ax.set_ylabel('Y')
-        plt.legend()
-        plt.suptitle('Least Squares Linear Regression', fontsize=24)
+        ax.legend()
+
+    def plot_data(self, save_name=None, mode='scatter', max_points=None,
+                  gridsize=100, **kwargs):
+        """Plot the data with regression line.
+
+        When save_name is given the plot is rendered off screen with the
+        Agg canvas and written to file without using pyplot, so headless
+        jobs never touch an interactive backend or the global figure state.
+
+        :param str save_name: path of the image file (default show the plot)
+        :param str mode: how the points are drawn, scatter (each point), \
+            hexbin or hist2d (point density in bins)
+        :param int max_points: scatter at most this many points, chosen at \
+            random (default all points)
+        :param int gridsize: number of bins along each axis for hexbin and \
+            hist2d
+        """
+        import seaborn  # noqa: F401
+
+        self.calc_slope()
+        self.calc_y_intercept()
+
+        if save_name:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+
+            fig = Figure(figsize=(5, 8), facecolor='white',
+                         edgecolor='black')
+            FigureCanvasAgg(fig)
+            ax = fig.add_subplot(1, 1, 1)
+        else:
+            import matplotlib.pyplot as plt
+
+            fig = plt.figure('Least Squares Linear Regression',
+                             figsize=(5, 8), facecolor='white',
+                             edgecolor='black')
+            ax = plt.subplot2grid((1, 1), (0, 0))
+
+        self.draw(ax, mode=mode, max_points=max_points, gridsize=gridsize)
+        fig.suptitle('Least Squares Linear Regression', fontsize=24)
 
         if save_name:
             name = osp.realpath(save_name)
-            plt.savefig(name, **kwargs)
+            fig.savefig(name, **kwargs)
         else:
             plt.show()
+
+
+def save_plots(regressions, save_names, **kwargs):
+    """Render many regressions to image files.
+
+    Each plot gets its own Agg figure, so no pyplot state is shared between
+    plots and nothing is left open once its file is written.
+
+    :param regressions: regressions with x and y values
+    :type: iterable(LeastSquares)
+    :param save_names: path of the image file for each regression
+    :type: iterable(str)
+    :param kwargs: options passed to LeastSquares.plot_data, such as mode, \
+        max_points, gridsize and savefig options
+    """
+    for regression, save_name in zip(regressions, save_names):
+        regression.plot_data(save_name=save_name, **kwargs)
+
+
+class RecursiveLeastSquares:
+    """Least Squares Linear Regression updated one point at a time.
+
+    :param int refresh: number of appended or removed points between exact \
+        recalculations from the retained points (None never recalculates \
+        and retains no points)
+
+    :Attributes:
+
+    - **points**: *deque* points (x, y) retained for exact recalculation
+    - **r**: *float* Pearson correlation of x and y
+    - **refresh**: *int* number of updates between exact recalculations
+    - **slope**: *float* slope of regression line
+    - **statistics**: *SufficientStatistics* statistics of the current \
+        points
+    - **updates**: *int* number of updates since the last recalculation
+    - **y_intercept**: *float* value where regression line intercepts y-axis
+
+    :Details:
+
+    append and remove update the sufficient statistics and coefficients in
+    constant time, independent of the number of points fitted. Removal
+    reverses the running update, so rounding error can accumulate over a
+    long stream of updates; setting refresh bounds that drift by rebuilding
+    the statistics from the retained points every refresh updates, at a
+    cost proportional to the number of points. Retained points are kept in
+    order and removed from the oldest end, as in a sliding window.
+    """
+    def __init__(self, refresh: int = None):
+        self.points = deque() if refresh else None
+        self.r = None
+        self.refresh = refresh
+        self.slope = None
+        self.statistics = SufficientStatistics()
+        self.updates = 0
+        self.y_intercept = None
+
+    def __repr__(self) -> str:
+        return f'RecursiveLeastSquares(refresh={self.refresh})'
+
+    def append(self, x: float, y: float):
+        """Add a point and update the coefficients.
+
+        :param float x: x value
+        :param float y: y value
+        """
+        if self.points is not None:
+            self.points.append((x, y))
+        self.statistics.combine(1, x, y, 0.0, 0.0, 0.0)
+        self.update()
+
+    def remove(self, x: float = None, y: float = None):
+        """Remove a point and update the coefficients.
+
+        When points are retained only the oldest point can be removed, which
+        keeps removal constant time; x and y may be omitted. Otherwise the
+        point to be removed must be given.
+
+        :param float x: x value (default the oldest retained point)
+        :param float y: y value (default the oldest retained point)
+        :raises ValueError: if the point is required and not given, or is \
+            not the oldest retained point
+        """
+        if self.points is None:
+            if x is None or y is None:
+                raise ValueError('x and y are required to remove a point '
+                                 'when points are not retained')
+        elif not self.points:
+            raise ValueError('there are no points to remove')
+        elif x is None and y is None:
+            x, y = self.points.popleft()
+        elif (x, y) == self.points[0]:
+            self.points.popleft()
+        else:
+            raise ValueError(f'({x}, {y}) is not the oldest retained point '
+                             f'{self.points[0]}')
+
+        if self.statistics.count <= 1:
+            self.statistics = SufficientStatistics()
+        else:
+            self.statistics.combine(-1, x, y, 0.0, 0.0, 0.0)
+        self.update()
+
+    def recalculate(self):
+        """Rebuild the statistics exactly from the retained points."""
+        self.statistics = SufficientStatistics()
+        if self.points:
+            x, y = zip(*self.points)
+            self.statistics.update(x, y)
+        self.updates = 0
+
+    def update(self):
+        """Count an update and refresh the coefficients."""
+        self.updates += 1
+        if self.refresh and self.updates >= self.refresh:
+            self.recalculate()
+        if self.statistics.count:
+            self.slope, self.y_intercept, self.r = \
+                self.statistics.coefficients()
+        else:
+            self.slope = self.y_intercept = self.r = None
+
+
+class BatchLeastSquares:
+    """Least Squares Linear Regression of many independent series at once.
+
+    :param ndarray x: x values, one series per row of a 2-D array or all \
+        series concatenated when offsets are given
+    :param ndarray y: y values in the same layout as x
+    :param ndarray offsets: index of the first value of each series in the \
+        concatenated x and y (series may differ in length but not be empty)
+
+    :Attributes:
+
+    - **offsets**: *ndarray* index of the first value of each series
+    - **r**: *ndarray* Pearson correlation of each series
+    - **slope**: *ndarray* slope of each regression line
+    - **x**: *ndarray* x values
+    - **y**: *ndarray* y values
+    - **y_intercept**: *ndarray* y-intercept of each regression line
+
+    :Details:
+
+    Every series is fitted in the same vectorized NumPy calls, matching
+    LeastSquares element by element: the slope is 0 for a series where x or
+    y has zero variance, and r is nan for that series.
+    """
+    def __init__(self, x: np.ndarray, y: np.ndarray,
+                 offsets: np.ndarray = None):
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        self.offsets = None if offsets is None else np.asarray(offsets)
+        self.r = None
+        self.slope = None
+        self.y_intercept = None
+
+    def __repr__(self) -> str:
+        return (f'BatchLeastSquares(x={self.x}, y={self.y}, '
+                f'offsets={self.offsets})')
+
+    def moments(self) -> tuple:
+        """Calculate the means and centered sums of every series.
+
+        :returns: mean of x, mean of y, sum of squared x deviations, sum of \
+            x and y deviation products and sum of squared y deviations
+        :rtype: tuple(ndarray, ndarray, ndarray, ndarray, ndarray)
+        """
+        if self.offsets is None:
+            mean_x = self.x.mean(axis=-1, keepdims=True)
+            mean_y = self.y.mean(axis=-1, keepdims=True)
+            dx = self.x - mean_x
+            dy = self.y - mean_y
+            return (mean_x[..., 0], mean_y[..., 0], (dx * dx).sum(axis=-1),
+                    (dx * dy).sum(axis=-1), (dy * dy).sum(axis=-1))
+
+        counts = np.diff(np.r_[self.offsets, self.x.shape[0]])
+        mean_x = np.add.reduceat(self.x, self.offsets) / counts
+        mean_y = np.add.reduceat(self.y, self.offsets) / counts
+        dx = self.x - np.repeat(mean_x, counts)
+        dy = self.y - np.repeat(mean_y, counts)
+        return (mean_x, mean_y, np.add.reduceat(dx * dx, self.offsets),
+                np.add.reduceat(dx * dy, self.offsets),
+                np.add.reduceat(dy * dy, self.offsets))
+
+    def fit(self):
+        """Calculate the slope, y-intercept and r of every series."""
+        mean_x, mean_y, sxx, sxy, syy = self.moments()
+        flat = (sxx == 0) | (syy == 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.slope = np.where(flat, 0.0, sxy / sxx)
+            self.r = np.where(flat, np.nan, sxy / np.sqrt(sxx * syy))
+        self.y_intercept = mean_y - self.slope * mean_x
+
+
+def _window_moments(x: np.ndarray, y: np.ndarray, window: int) -> tuple:
+    """Means and centered sums of every window of a block of points.
+
+    The cumulative sums are taken about the mean of the block, so their
+    rounding error depends on the block and not on its place in a series.
+
+    :param ndarray x: x values
+    :param ndarray y: y values
+    :param int window: number of points in each window
+    :returns: mean of x, mean of y, centered sums sxx, sxy and syy, and the \
+        sums of squares of x and y about the block mean
+    :rtype: tuple(ndarray, ...)
+    """
+    center_x = x.mean()
+    center_y = y.mean()
+    dx = x - center_x
+    dy = y - center_y
+    totals = [np.cumsum(np.r_[0.0, values])
+              for values in (dx, dy, dx * dx, dx * dy, dy * dy)]
+    sum_x, sum_y, sum_xx, sum_xy, sum_yy = [
+        total[window:] - total[:-window] for total in totals]
+    return (sum_x / window + center_x, sum_y / window + center_y,
+            sum_xx - sum_x * sum_x / window, sum_xy - sum_x * sum_y / window,
+            sum_yy - sum_y * sum_y / window, sum_xx, sum_yy)
+
+
+def rolling_least_squares(x: np.ndarray, y: np.ndarray, window: int,
+                          tolerance: float = 1e-10,
+                          block: int = None) -> Coefficients:
+    """Fit a least squares line to every window of consecutive points.
+
+    The windowed sums of x, y, x^2, x*y and y^2 are differences of
+    cumulative sums, so every window is fitted in O(n) total. The series is
+    processed in overlapping blocks, each centered on its own mean, so the
+    cancellation error of the differences does not grow with the length of
+    the series. A window is treated as having zero variance, slope 0 and r
+    nan, when its centered sum of squares is within tolerance of its own
+    sum of squares about the block mean.
+
+    :param ndarray x: x values
+    :param ndarray y: y values
+    :param int window: number of points in each window
+    :param float tolerance: relative size of a window's centered sums of \
+        squares below which the window is flat
+    :param int block: number of windows fitted from each block (default \
+        the larger of 1024 and 4 * window)
+    :returns: slope, y-intercept and r of the window ending at each point \
+        from window - 1 onward
+    :rtype: Coefficients
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if window < 1 or window > x.size:
+        empty = np.empty(0)
+        return Coefficients(empty, empty, empty)
+
+    windows = x.size - window + 1
+    block = block or max(1024, 4 * window)
+    blocks = [_window_moments(x[start:start + block + window - 1],
+                              y[start:start + block + window - 1], window)
+              for start in range(0, windows, block)]
+    mean_x, mean_y, sxx, sxy, syy, sum_xx, sum_yy = [
+        np.concatenate(values) for values in zip(*blocks)]
+
+    flat = (sxx <= tolerance * sum_xx) | (syy <= tolerance * sum_yy)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = np.where(flat, 0.0, sxy / sxx)
+        r = np.where(flat, np.nan, sxy / np.sqrt(sxx * syy))
+    return Coefficients(slope, mean_y - slope * mean_x, r)
+
+
+def _share_sample(x: np.ndarray, y: np.ndarray):
+    """Store the sample in a pool worker once instead of with every batch.
+
+    :param ndarray x: x values
+    :param ndarray y: y values
+    """
+    global _sample
+    _sample = (x, y)
+
+
+def _bootstrap_batch(size: int, seed: np.random.SeedSequence,
+                     sample: tuple = None) -> tuple:
+    """Fit a batch of resamples of a sample.
+
+    :param int size: number of resamples
+    :param SeedSequence seed: seed of the resample indices
+    :param tuple sample: x and y values (default the sample shared with \
+        the pool worker)
+    :returns: slope and y-intercept of every resample
+    :rtype: tuple(ndarray, ndarray)
+    """
+    x, y = sample or _sample
+    indices = np.random.default_rng(seed).integers(0, x.size, (size, x.size))
+    batch = BatchLeastSquares(x=x[indices], y=y[indices])
+    batch.fit()
+    return batch.slope, batch.y_intercept
+
+
+def bootstrap(x: np.ndarray, y: np.ndarray, resamples: int = 1000,
+              confidence: float = 0.95, batch_size: int = None,
+              processes: int = None, seed: int = None) -> Intervals:
+    """Bootstrap percentile confidence intervals of the regression line.
+
+    Resamples are drawn as matrices of indices into x and y, one row per
+    resample, and each matrix is fitted in one BatchLeastSquares call.
+    Every batch is seeded by its own child of a SeedSequence, so the
+    intervals for a given seed do not depend on the number of processes.
+
+    :param ndarray x: x values
+    :param ndarray y: y values
+    :param int resamples: number of resamples
+    :param float confidence: confidence level of the intervals
+    :param int batch_size: number of resamples fitted together (default \
+        limits each index matrix to about 4 million entries)
+    :param int processes: number of worker processes (default fits every \
+        batch in this process)
+    :param int seed: seed of the resamples
+    :returns: (low, high) percentile interval of each coefficient
+    :rtype: Intervals
+    """
+    x = np.asarray(x, dtype=np.float64).ravel()
+    y = np.asarray(y, dtype=np.float64).ravel()
+    batch_size = batch_size or max(1, 2 ** 22 // max(x.size, 1))
+    sizes = [min(batch_size, resamples - start)
+             for start in range(0, resamples, batch_size)]
+    jobs = list(zip(sizes, np.random.SeedSequence(seed).spawn(len(sizes))))
+
+    if processes:
+        with mp.Pool(processes=processes, initializer=_share_sample,
+                     initargs=(x, y)) as pool:
+            fits = pool.starmap(_bootstrap_batch, jobs)
+    else:
+        fits = [_bootstrap_batch(*job, sample=(x, y)) for job in jobs]
+
+    slopes, intercepts = (np.concatenate(values) for values in zip(*fits))
+    tail = (1 - confidence) / 2 * 100
+    return Intervals(*(tuple(np.percentile(values, [tail, 100 - tail]))
+                       for values in (slopes, intercepts)))
@@ -6,21 +6,135 @@
 .. moduleauthor:: Timothy Helton <timothy.j.helton@gmail.com>
 """
 
+import bisect
+from collections import namedtuple
+import datetime
 import logging
 import math
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import os.path as osp
 from typing import Tuple, Union
 
+import numpy as np
 
-# Set Up Logger
+from . import regression
+
+
+# Set Up Logger (level and output are left to the application)
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-date_format = '%m/%d/%Y %I:%M:%S'
-log_format = ('%(asctime)s  %(levelname)8s  -> %(name)s <- '
-              '(line: %(lineno)d) %(message)s\n')
-formatter = logging.Formatter(fmt=log_format, datefmt=date_format)
-console_handler = logging.StreamHandler()
-console_handler.setFormatter(formatter)
-logger.addHandler(console_handler)
+logger.addHandler(logging.NullHandler())
+
+
+SearchResults = namedtuple('SearchResults',
+                           ('item_idx', 'steps', 'found', 'max_steps'))
+
+
+def _as_array(values: Union[str, tuple, list, iter, np.ndarray]) \
+        -> np.ndarray:
+    """Convert a set of searchable values to a one dimensional array.
+
+    :param values: all values to be searched
+    :type: str | tuple | list | iter | ndarray
+    :returns: values as an array (no copy is made for arrays)
+    :rtype: ndarray
+    """
+    if isinstance(values, str):
+        return np.array(list(values))
+    return np.asarray(values)
+
+
+def _distance(high: object, low: object) -> float:
+    """Numeric distance between two values, used to interpolate positions.
+
+    Differences of datetime and datetime64 values are measured in seconds.
+
+    :param high: larger value
+    :param low: smaller value
+    :returns: high - low as a float
+    :rtype: float
+    :raises TypeError: if the values have no numeric difference
+    """
+    difference = high - low
+    if isinstance(difference, datetime.timedelta):
+        return difference.total_seconds()
+    if isinstance(difference, np.timedelta64):
+        return float(difference / np.timedelta64(1, 's'))
+    return float(difference)
+
+
+def _probe_many(values: np.ndarray, items: np.ndarray) \
+        -> Tuple[np.ndarray, np.ndarray]:
+    """Perform the BinarySearch probe sequence for many items at once.
+
+    Every query follows exactly the same sequence of median probes as
+    :meth:`BinarySearch.find_index`, but all queries are advanced together
+    one probe per loop iteration, so the Python level work is proportional to
+    log n instead of the number of queries.
+
+    :param ndarray values: sorted values to be searched
+    :param ndarray items: one dimensional array of items to be found
+    :returns: item indices (-1 for items not found) and number of search \
+        steps for each item
+    :rtype: tuple(ndarray, ndarray)
+    """
+    size = values.shape[0]
+    item_idx = np.full(items.shape, -1, dtype=np.intp)
+    steps = np.zeros(items.shape, dtype=np.intp)
+
+    position = np.arange(items.shape[0])
+    target = items
+    low = np.zeros(items.shape, dtype=np.intp)
+    high = np.full(items.shape, size, dtype=np.intp)
+    while position.size:
+        live = (low <= high) & (low < size)
+        if not live.all():
+            position, target = position[live], target[live]
+            low, high = low[live], high[live]
+            if not position.size:
+                break
+
+        med_idx = (low + high) // 2
+        steps[position] += 1
+        med_value = values[med_idx]
+
+        hit = med_value == target
+        item_idx[position[hit]] = med_idx[hit]
+        greater = med_value > target
+        high = np.where(greater, med_idx - 1, high)
+        low = np.where(greater, low, med_idx + 1)
+
+        miss = ~hit
+        position, target = position[miss], target[miss]
+        low, high = low[miss], high[miss]
+
+    return item_idx, steps
+
+
+_shared_values = None
+
+
+def _attach_values(name: str, shape: tuple, dtype: str):
+    """Attach a pool worker to the shared memory block holding the values.
+
+    :param str name: name of the shared memory block
+    :param tuple shape: shape of the values array
+    :param str dtype: data type of the values array
+    """
+    global _shared_values
+    block = shared_memory.SharedMemory(name=name)
+    _shared_values = (block, np.ndarray(shape, dtype=dtype, buffer=block.buf))
+
+
+def _probe_shared(items: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Run the vectorized probe sequence in a worker over the shared values.
+
+    :param ndarray items: one dimensional array of items to be found
+    :returns: item indices (-1 for items not found) and number of search \
+        steps for each item
+    :rtype: tuple(ndarray, ndarray)
+    """
+    return _probe_many(_shared_values[1], items)
 
 
 class BaseSearch:
@@ -53,11 +167,45 @@ class BaseSearch:
         self.values = values
 
     def log_n(self):
-        """Determine the number of steps required if O(log n)."""
+        """Determine the number of steps required if O(log n).
+
+        max_steps is ceil(log2 n), or 0 for empty values. A binary search
+        that tests for equality at each probe makes at most
+        floor(log2 n) + 1 probes, which is one more than max_steps when n is
+        a power of two.
+        """
         try:
-            self.max_steps = math.ceil(math.log2(len(self.values)))
+            size = len(self.values)
         except TypeError:
             self.no_values()
+            return
+        self.max_steps = math.ceil(math.log2(size)) if size else 0
+
+    def count_bound(self, item: Union[str, int, float], right: bool = False,
+                    low: int = 0, high: int = None) -> int:
+        """Step counting bisection for any indexable sorted values.
+
+        :param item: item to be located
+        :type: str | int | float
+        :param bool right: if True return the index after the last item \
+            equal to item (upper bound) instead of the first (lower bound)
+        :param int low: first index of the values to be searched
+        :param int high: index after the last value to be searched, \
+            defaults to the length of the values
+        :returns: insertion point for the item
+        :rtype: int
+        """
+        values = self.values
+        high = len(values) if high is None else high
+        while low < high:
+            self.steps += 1
+            med_idx = (low + high) // 2
+            med_value = values[med_idx]
+            if item < med_value or (not right and med_value == item):
+                high = med_idx
+            else:
+                low = med_idx + 1
+        return low
 
     @staticmethod
     def no_values():
@@ -71,8 +219,14 @@ class BinarySearch(BaseSearch):
 
     :Attributes:
 
+    - **insert_idx**: *int* index where a missing item would be inserted to \
+        keep the values sorted (lower bound), None if the item was found
+
     :Details:
 
+    The search is iterative and stops as soon as the low and high indices
+    cross, so at most floor(log2 n) + 1 probes are made even when the item is
+    not present in the values.
     """
     def __init__(self, **kwargs):
         super(BinarySearch, self).__init__(**kwargs)
@@ -85,6 +239,9 @@ class BinarySearch(BaseSearch):
             self._low_idx = None
             self._high_idx = None
             self._med_idx = None
+        self.insert_idx = None
+        self._array = None
+        self._array_source = None
 
     def __repr__(self) -> str:
         return "BinarySearch(item={}, values={})".format(self.item,
@@ -104,24 +261,1112 @@ class BinarySearch(BaseSearch):
 
     def find_index(self):
         """Find the index of the item in the argument of values."""
-        self.steps += 1
-        med_value = self.calc_median()
-        if med_value == self.item:
-            self.item_idx = self._med_idx
-        elif med_value > self.item:
-            self._high_idx = self._med_idx - 1
-            self.find_index()
-        else:
-            self._low_idx = self._med_idx + 1
-            self.find_index()
+        if self.values is None:
+            self.no_values()
+            return
+
+        size = len(self.values)
+        self.item_idx = None
+        self.insert_idx = None
+        while self._low_idx <= self._high_idx and self._low_idx < size:
+            self.steps += 1
+            med_value = self.calc_median()
+            if med_value == self.item:
+                self.item_idx = self._med_idx
+                return
+            elif med_value > self.item:
+                self._high_idx = self._med_idx - 1
+            else:
+                self._low_idx = self._med_idx + 1
+        self.insert_idx = self._low_idx
 
     def search(self) -> Tuple[int, int, int]:
         """Notify the user of the item index and number of search steps.
 
+        If the item is not in the values the item index is None and the
+        insertion point is available from the insert_idx attribute.
+
         :returns: item index, actual number of search steps and maximum \
             possible number of search steps
         """
         self.steps = 0
+        if self.values is not None:
+            self._low_idx = 0
+            self._high_idx = len(self.values)
         self.log_n()
         self.find_index()
         return self.item_idx, self.steps, self.max_steps
+
+    def lower_bound(self, item: Union[str, int, float] = None) -> int:
+        """Find the first index where the item could be inserted in order.
+
+        Lists and tuples are handed to :func:`bisect.bisect_left` directly,
+        which skips the step accounting; other values count steps as usual.
+
+        :param item: item to be located, defaults to the item attribute
+        :type: str | int | float
+        :returns: lower bound insertion point for the item
+        :rtype: int
+        """
+        return self._bound(item, right=False)
+
+    def upper_bound(self, item: Union[str, int, float] = None) -> int:
+        """Find the last index where the item could be inserted in order.
+
+        Lists and tuples are handed to :func:`bisect.bisect_right` directly,
+        which skips the step accounting; other values count steps as usual.
+
+        :param item: item to be located, defaults to the item attribute
+        :type: str | int | float
+        :returns: upper bound insertion point for the item
+        :rtype: int
+        """
+        return self._bound(item, right=True)
+
+    def _bound(self, item, right):
+        """Dispatch a bound query to bisect or the step counting loop."""
+        if self.values is None:
+            self.no_values()
+            return None
+
+        item = self.item if item is None else item
+        self.steps = 0
+        self.log_n()
+        if isinstance(self.values, (list, tuple)):
+            if right:
+                return bisect.bisect_right(self.values, item)
+            return bisect.bisect_left(self.values, item)
+        return self.count_bound(item, right=right)
+
+    def search_many(self, items: Union[tuple, list, np.ndarray]) \
+            -> SearchResults:
+        """Search for many items against the values in one vectorized pass.
+
+        The values are converted to an array once and reused for subsequent
+        calls as long as the values attribute is not replaced.
+
+        :param items: items to be found
+        :type: tuple | list | ndarray
+        :returns: item indices (-1 if not found), actual number of search \
+            steps for each item, mask of the items found and maximum \
+            possible number of search steps
+        :rtype: SearchResults
+        """
+        if self.values is None:
+            self.no_values()
+            return None
+
+        if self._array_source is not self.values:
+            self._array = _as_array(self.values)
+            self._array_source = self.values
+
+        items = np.asarray(items)
+        shape = items.shape
+        item_idx, steps = _probe_many(self._array, items.ravel())
+
+        self.log_n()
+        return SearchResults(item_idx.reshape(shape), steps.reshape(shape),
+                             item_idx.reshape(shape) >= 0, self.max_steps)
+
+
+class SortedIndex(BinarySearch):
+    """Build once index supporting point, range, rank and count queries.
+
+    :param values: all values to be indexed, sorted during the build
+    :type: str | tuple | list | iter
+    :param key: function extracting the comparison key from each value
+    :type: callable
+    :param bool unique: if True only the first value for each key is kept
+
+    :Attributes:
+
+    - **key**: *callable* function extracting the comparison key
+    - **records**: *list* values sorted by key
+    - **unique**: *bool* if True duplicate keys were dropped during the build
+    - **values**: *list* sorted keys searched by every query
+
+    :Details:
+
+    Every query resets steps to the number of probes it needed, so steps can
+    be compared against max_steps as with :meth:`BinarySearch.search`.
+    """
+    def __init__(self, values: Union[str, tuple, list, iter] = None,
+                 key=None, unique: bool = False):
+        self.key = key
+        self.unique = unique
+        self.records = sorted(values, key=key) if values is not None else None
+        keys = self.records
+        if keys is not None and key is not None:
+            keys = [key(x) for x in keys]
+        if keys is not None and unique:
+            keep = [n for n, x in enumerate(keys)
+                    if n == 0 or keys[n - 1] != x]
+            self.records = [self.records[n] for n in keep]
+            keys = [keys[n] for n in keep]
+        super(SortedIndex, self).__init__(values=keys)
+
+    def __repr__(self) -> str:
+        return f'SortedIndex(values={self.records}, unique={self.unique})'
+
+    def _reset(self) -> bool:
+        """Reset step accounting ahead of a query."""
+        if self.values is None:
+            self.no_values()
+            return False
+        self.steps = 0
+        self.log_n()
+        return True
+
+    def find(self, item: Union[str, int, float]) -> Tuple[int, int, int]:
+        """Find the first index of a key.
+
+        :param item: key to be found
+        :type: str | int | float
+        :returns: item index (None if not found), actual number of search \
+            steps and maximum possible number of search steps
+        """
+        if not self._reset():
+            return None
+        self.item = item
+        idx = self.count_bound(item)
+        if idx < len(self.values) and self.values[idx] == item:
+            self.item_idx = idx
+            self.insert_idx = None
+        else:
+            self.item_idx = None
+            self.insert_idx = idx
+        return self.item_idx, self.steps, self.max_steps
+
+    def range_scan(self, low: Union[str, int, float],
+                   high: Union[str, int, float]) -> list:
+        """Find all records with keys in the half open interval [low, high).
+
+        :param low: lowest key included
+        :type: str | int | float
+        :param high: first key excluded
+        :type: str | int | float
+        :returns: records with keys in the interval
+        :rtype: list
+        """
+        if not self._reset():
+            return None
+        start = self.count_bound(low)
+        stop = self.count_bound(high)
+        return self.records[start:max(start, stop)]
+
+    def rank(self, item: Union[str, int, float]) -> int:
+        """Determine the number of keys less than the item.
+
+        :param item: key to be ranked
+        :type: str | int | float
+        :returns: number of keys less than the item
+        :rtype: int
+        """
+        if not self._reset():
+            return None
+        return self.count_bound(item)
+
+    def count(self, item: Union[str, int, float]) -> int:
+        """Determine the number of keys equal to the item.
+
+        :param item: key to be counted
+        :type: str | int | float
+        :returns: number of keys equal to the item
+        :rtype: int
+        """
+        if not self._reset():
+            return None
+        return self.count_bound(item, right=True) - self.count_bound(item)
+
+
+class InterpolationSearch(BaseSearch):
+    """Methods related to performing an interpolation search algorithm.
+
+    :Details:
+
+    The probe position is interpolated linearly between the values at the
+    low and high indices, which needs O(log log n) steps for uniformly
+    distributed numeric values. Timestamps (datetime and datetime64) are
+    interpolated on their differences in seconds. Once max_steps probes have
+    been made without finding the item the remaining probes fall back to the
+    median, so skewed values cost at most twice the binary search steps.
+    """
+    def __init__(self, **kwargs):
+        super(InterpolationSearch, self).__init__(**kwargs)
+
+    def __repr__(self) -> str:
+        return f'InterpolationSearch(item={self.item}, values={self.values})'
+
+    def search(self) -> Tuple[int, int, int]:
+        """Notify the user of the item index and number of search steps.
+
+        :returns: item index (None if not found), actual number of search \
+            steps and maximum possible number of search steps
+        """
+        self.steps = 0
+        self.item_idx = None
+        if self.values is None:
+            self.no_values()
+            return None
+        self.log_n()
+
+        values = self.values
+        item = self.item
+        low = 0
+        high = len(values) - 1
+        while low <= high and values[low] <= item <= values[high]:
+            self.steps += 1
+            low_value = values[low]
+            high_value = values[high]
+            if self.steps > self.max_steps or high_value == low_value:
+                probe = (low + high) // 2
+            else:
+                fraction = (_distance(item, low_value)
+                            / _distance(high_value, low_value))
+                probe = low + int(fraction * (high - low))
+            probe_value = values[probe]
+            if probe_value == item:
+                self.item_idx = probe
+                break
+            elif probe_value < item:
+                low = probe + 1
+            else:
+                high = probe - 1
+        return self.item_idx, self.steps, self.max_steps
+
+
+class ExponentialSearch(BaseSearch):
+    """Methods related to performing an exponential search algorithm.
+
+    :param int start: index where the search begins
+
+    :Attributes:
+
+    - **insert_idx**: *int* index where a missing item would be inserted to \
+        keep the values sorted, None if the item was found
+    - **start**: *int* index where the search begins
+
+    :Details:
+
+    Starting at the start index the probe distance doubles until the item is
+    bracketed, then the bracket is bisected. An item d positions away from
+    the start is found in O(log d) steps.
+    """
+    def __init__(self, start: int = 0, **kwargs):
+        super(ExponentialSearch, self).__init__(**kwargs)
+        self.start = start
+        self.insert_idx = None
+
+    def __repr__(self) -> str:
+        return (f'{type(self).__name__}(item={self.item}, '
+                f'values={self.values}, start={self.start})')
+
+    def gallop(self) -> Tuple[int, int]:
+        """Double the probe distance from start until the item is bracketed.
+
+        :returns: low and high indices bracketing the lower bound of the item
+        :rtype: tuple(int, int)
+        """
+        values = self.values
+        item = self.item
+        size = len(values)
+        start = min(max(self.start, 0), size - 1)
+
+        self.steps += 1
+        step = 1
+        if values[start] < item:
+            low = start + 1
+            high = start + step
+            while high < size:
+                self.steps += 1
+                if not values[high] < item:
+                    return low, high
+                low = high + 1
+                step *= 2
+                high = start + step
+            return low, size
+
+        high = start
+        low = start - step
+        while low >= 0:
+            self.steps += 1
+            if values[low] < item:
+                return low + 1, high
+            high = low
+            step *= 2
+            low = start - step
+        return 0, high
+
+    def search(self) -> Tuple[int, int, int]:
+        """Notify the user of the item index and number of search steps.
+
+        :returns: item index (None if not found), actual number of search \
+            steps and maximum possible number of search steps
+        """
+        self.steps = 0
+        self.item_idx = None
+        self.insert_idx = None
+        if self.values is None:
+            self.no_values()
+            return None
+        self.log_n()
+        if not len(self.values):
+            self.insert_idx = 0
+            return self.item_idx, self.steps, self.max_steps
+
+        low, high = self.gallop()
+        idx = self.count_bound(self.item, low=low, high=high)
+        if idx < len(self.values) and self.values[idx] == self.item:
+            self.item_idx = idx
+        else:
+            self.insert_idx = idx
+        return self.item_idx, self.steps, self.max_steps
+
+
+class GallopingSearch(ExponentialSearch):
+    """Methods related to performing a galloping search algorithm.
+
+    :Details:
+
+    Exponential search whose start index follows the previous result, so a
+    sequence of lookups landing near each other costs O(log d) steps each,
+    where d is the distance from the previous hit or insertion point.
+    """
+    def __init__(self, **kwargs):
+        super(GallopingSearch, self).__init__(**kwargs)
+
+    def search(self) -> Tuple[int, int, int]:
+        """Notify the user of the item index and number of search steps.
+
+        :returns: item index (None if not found), actual number of search \
+            steps and maximum possible number of search steps
+        """
+        result = super(GallopingSearch, self).search()
+        if self.item_idx is not None:
+            self.start = self.item_idx
+        elif self.insert_idx is not None:
+            self.start = self.insert_idx
+        return result
+
+
+class AdaptiveSearch(BaseSearch):
+    """Select a search algorithm from a sample of the values.
+
+    :param int sample_size: number of evenly spaced values sampled
+    :param float tolerance: largest deviation of a sampled value from its \
+        linearly interpolated position, as a fraction of the number of \
+        values, still treated as uniformly distributed
+    :param int start: index of the expected item location, if provided \
+        lookups are assumed to land near the previous one
+
+    :Attributes:
+
+    - **strategy**: *BaseSearch* search instance selected for the values
+
+    :Details:
+
+    - Numeric or timestamp values that are close to uniformly distributed
+      use InterpolationSearch.
+    - When a start index is provided GallopingSearch is used.
+    - Otherwise BinarySearch is used.
+    """
+    def __init__(self, sample_size: int = 64, tolerance: float = 0.05,
+                 start: int = None, **kwargs):
+        super(AdaptiveSearch, self).__init__(**kwargs)
+        self.sample_size = sample_size
+        self.tolerance = tolerance
+        self.start = start
+        self.strategy = None
+
+    def __repr__(self) -> str:
+        return f'AdaptiveSearch(item={self.item}, values={self.values})'
+
+    def is_uniform(self) -> bool:
+        """Determine if the sampled values are close to uniformly spaced.
+
+        :returns: True if every sampled value is within tolerance of its \
+            linearly interpolated position
+        :rtype: bool
+        """
+        values = self.values
+        size = len(values)
+        if size < 3:
+            return False
+
+        positions = np.linspace(0, size - 1, min(self.sample_size, size))
+        positions = positions.astype(np.intp)
+        try:
+            span = _distance(values[-1], values[0])
+            sample = np.array([_distance(values[x], values[0])
+                               for x in positions])
+        except TypeError:
+            return False
+        if not span > 0:
+            return False
+
+        predicted = sample / span * (size - 1)
+        return np.max(np.abs(predicted - positions)) <= self.tolerance * size
+
+    def select(self) -> BaseSearch:
+        """Select the search algorithm for the values.
+
+        :returns: search instance selected for the values
+        :rtype: BaseSearch
+        """
+        if self.values is None:
+            self.no_values()
+            return None
+
+        if self.start is not None:
+            self.strategy = GallopingSearch(start=self.start,
+                                            values=self.values)
+        elif self.is_uniform():
+            self.strategy = InterpolationSearch(values=self.values)
+        else:
+            self.strategy = BinarySearch(values=self.values)
+        return self.strategy
+
+    def search(self) -> Tuple[int, int, int]:
+        """Notify the user of the item index and number of search steps.
+
+        :returns: item index (None if not found), actual number of search \
+            steps and maximum possible number of search steps
+        """
+        if self.strategy is None or self.strategy.values is not self.values:
+            if self.select() is None:
+                return None
+
+        self.strategy.item = self.item
+        result = self.strategy.search()
+        self.item_idx, self.steps, self.max_steps = result
+        return result
+
+
+class EytzingerSearch(BaseSearch):
+    """Binary search over values re-laid out in Eytzinger (BFS) order.
+
+    :Attributes:
+
+    - **insert_idx**: *int* index where a missing item would be inserted to \
+        keep the values sorted, None if the item was found
+    - **layout**: *ndarray* values in Eytzinger order, position k has \
+        children 2k and 2k + 1 (position 0 is unused)
+    - **order**: *ndarray* index into the sorted values for each layout \
+        position (position 0 maps to the number of values)
+
+    :Details:
+
+    The first levels of the implicit tree share a handful of cache lines, so
+    every search walks memory front to back instead of jumping across the
+    whole table. Indices returned refer to the original sorted values, so
+    the class drops in where :meth:`BinarySearch.search` is used. Duplicate
+    values resolve to the first occurrence. The layout is rebuilt when the
+    values are replaced.
+    """
+    def __init__(self, **kwargs):
+        super(EytzingerSearch, self).__init__(**kwargs)
+        self.insert_idx = None
+        self._layout_source = None
+        self.layout = None
+        self.order = None
+        if self.values is not None:
+            self.build()
+
+    def __repr__(self) -> str:
+        return f'EytzingerSearch(item={self.item}, values={self.values})'
+
+    def build(self):
+        """Re-lay out the sorted values in Eytzinger order."""
+        self._layout_source = self.values
+        values = _as_array(self.values)
+        size = values.shape[0]
+        depth = size.bit_length()
+
+        subtree = np.zeros(size + 1, dtype=np.int64)
+        for level in range(depth - 1, -1, -1):
+            nodes = np.arange(2 ** level, min(2 ** (level + 1), size + 1))
+            for child in (2 * nodes, 2 * nodes + 1):
+                valid = child <= size
+                subtree[nodes[valid]] += subtree[child[valid]]
+            subtree[nodes] += 1
+
+        start = np.zeros(size + 1, dtype=np.int64)
+        order = np.zeros(size + 1, dtype=np.int64)
+        for level in range(depth):
+            nodes = np.arange(2 ** level, min(2 ** (level + 1), size + 1))
+            if level:
+                parent = nodes // 2
+                start[nodes] = np.where(nodes % 2, order[parent] + 1,
+                                        start[parent])
+            left = 2 * nodes
+            valid = left <= size
+            order[nodes] = start[nodes]
+            order[nodes[valid]] += subtree[left[valid]]
+        order[0] = size
+
+        self.order = order
+        self.layout = np.empty(size + 1, dtype=values.dtype)
+        self.layout[1:] = values[order[1:]]
+        if size:
+            self.layout[0] = values[0]
+
+    def search(self) -> Tuple[int, int, int]:
+        """Notify the user of the item index and number of search steps.
+
+        :returns: item index (None if not found), actual number of search \
+            steps and maximum possible number of search steps
+        """
+        self.steps = 0
+        self.item_idx = None
+        self.insert_idx = None
+        if self.values is None:
+            self.no_values()
+            return None
+        if self._layout_source is not self.values:
+            self.build()
+        self.log_n()
+
+        layout = self.layout
+        size = layout.shape[0] - 1
+        k = 1
+        while k <= size:
+            self.steps += 1
+            k = 2 * k + int(layout[k] < self.item)
+        k >>= ((~k) & (k + 1)).bit_length()
+
+        if k and layout[k] == self.item:
+            self.item_idx = int(self.order[k])
+        else:
+            self.insert_idx = int(self.order[k])
+        return self.item_idx, self.steps, self.max_steps
+
+    def search_many(self, items: Union[tuple, list, np.ndarray]) \
+            -> SearchResults:
+        """Search for many items against the layout in one vectorized pass.
+
+        :param items: items to be found
+        :type: tuple | list | ndarray
+        :returns: item indices (-1 if not found), actual number of search \
+            steps for each item, mask of the items found and maximum \
+            possible number of search steps
+        :rtype: SearchResults
+        """
+        if self.values is None:
+            self.no_values()
+            return None
+        if self._layout_source is not self.values:
+            self.build()
+        self.log_n()
+
+        layout = self.layout
+        size = layout.shape[0] - 1
+        items = np.asarray(items)
+        k = np.ones(items.shape, dtype=np.int64)
+        steps = np.zeros(items.shape, dtype=np.intp)
+        for _ in range(size.bit_length()):
+            inside = k <= size
+            steps += inside
+            probe = layout[np.minimum(k, size)] < items
+            k = np.where(inside, 2 * k + probe, k)
+        k //= 2 * ((~k) & (k + 1))
+
+        found = (k > 0) & (layout[k] == items)
+        item_idx = np.where(found, self.order[k], -1)
+        return SearchResults(item_idx, steps, found, self.max_steps)
+
+
+class MemoryMappedSearch(BinarySearch):
+    """Binary search directly over sorted records in a memory mapped file.
+
+    :param str path: path to a .npy file or a raw file of fixed width records
+    :param key_dtype: data type of the key leading each raw record
+    :type: str | dtype
+    :param int payload_width: number of bytes following the key in each raw \
+        record
+    :param item: item to be found
+    :type: str | int | float
+
+    :Attributes:
+
+    - **path**: *str* path to the mapped file
+    - **records**: *memmap* mapped records
+    - **values**: *ndarray* view of the keys in the mapped records
+
+    :Details:
+
+    A .npy file holds either the keys themselves or structured records with
+    a "key" field (and optionally a "payload" field). A raw file holds
+    records of a key of key_dtype followed by payload_width bytes. Nothing
+    is read until a search probes a record, so only the pages along the
+    search path are loaded.
+    """
+    def __init__(self, path: str, key_dtype='<i8', payload_width: int = 0,
+                 item: Union[str, int, float] = None):
+        self.path = path
+        self.key_dtype = np.dtype(key_dtype)
+        self.payload_width = payload_width
+        self.records = self.open()
+        if self.records.dtype.names and 'key' in self.records.dtype.names:
+            values = self.records['key']
+        else:
+            values = self.records
+        super(MemoryMappedSearch, self).__init__(item=item, values=values)
+
+    def __repr__(self) -> str:
+        return f'MemoryMappedSearch(path={self.path}, item={self.item})'
+
+    @staticmethod
+    def record_dtype(key_dtype='<i8', payload_width: int = 0) -> np.dtype:
+        """Data type of a raw record.
+
+        :param key_dtype: data type of the key leading each record
+        :type: str | dtype
+        :param int payload_width: number of bytes following the key
+        :returns: record data type
+        :rtype: dtype
+        """
+        if not payload_width:
+            return np.dtype(key_dtype)
+        return np.dtype([('key', key_dtype), ('payload', f'V{payload_width}')])
+
+    @classmethod
+    def write(cls, path: str, keys: np.ndarray, payloads: list = None,
+              key_dtype='<i8', payload_width: int = 0):
+        """Write sorted keys and optional payloads as raw fixed width records.
+
+        :param str path: path to the file to be written
+        :param ndarray keys: sorted keys
+        :param list payloads: bytes stored after each key, padded with null \
+            bytes to payload_width
+        :param key_dtype: data type of the keys
+        :type: str | dtype
+        :param int payload_width: number of bytes following each key
+        """
+        records = np.empty(len(keys), dtype=cls.record_dtype(key_dtype,
+                                                             payload_width))
+        if payload_width:
+            records['key'] = keys
+            width = f'S{payload_width}'
+            records['payload'] = np.array(payloads, dtype=width).view(
+                f'V{payload_width}')
+        else:
+            records[:] = keys
+        records.tofile(path)
+
+    def open(self) -> np.ndarray:
+        """Memory map the records in the file.
+
+        :returns: read only mapped records
+        :rtype: memmap
+        """
+        if osp.splitext(self.path)[1] == '.npy':
+            return np.load(self.path, mmap_mode='r')
+        dtype = self.record_dtype(self.key_dtype, self.payload_width)
+        if not osp.getsize(self.path):
+            return np.empty(0, dtype=dtype)
+        return np.memmap(self.path, mode='r', dtype=dtype)
+
+    def payload(self, idx: int = None) -> bytes:
+        """Retrieve the payload of a record.
+
+        :param int idx: record index, defaults to the index of the last item \
+            found
+        :returns: payload of the record, None if there is no record
+        :rtype: bytes
+        """
+        idx = self.item_idx if idx is None else idx
+        names = self.records.dtype.names
+        if idx is None or not names or 'payload' not in names:
+            return None
+        payload = self.records[idx]['payload']
+        if isinstance(payload, np.void):
+            return payload.tobytes()
+        return payload
+
+
+class ShardedIndex:
+    """Point and range lookups over many sorted shards with fence pointers.
+
+    :param list paths: paths to the sorted shard files (see \
+        :class:`MemoryMappedSearch` for the supported formats)
+    :param int block_size: number of records covered by each fence pointer
+    :param key_dtype: data type of the key leading each raw record
+    :type: str | dtype
+    :param int payload_width: number of bytes following the key in each raw \
+        record
+
+    :Attributes:
+
+    - **block_size**: *int* number of records covered by each fence pointer
+    - **fences**: *list* first key of every block for each shard
+    - **limits**: *list* (minimum key, maximum key) for each shard, None for \
+        empty shards
+    - **paths**: *list* paths to the sorted shard files
+    - **shards**: *list* MemoryMappedSearch instance for each shard
+    - **steps**: *int* number of search steps made in mapped blocks by the \
+        last lookup
+
+    :Details:
+
+    The fences and limits are small and held in memory, so a lookup skips
+    shards that cannot hold the key and bisects a single block of each
+    remaining shard. Fence pointers are written next to each shard with the
+    suffix ".fence.npz" and reused on reopen while they are newer than the
+    shard and were built with the same block size.
+    """
+    def __init__(self, paths: list, block_size: int = 4096, key_dtype='<i8',
+                 payload_width: int = 0):
+        self.paths = list(paths)
+        self.block_size = block_size
+        self.shards = [MemoryMappedSearch(x, key_dtype=key_dtype,
+                                          payload_width=payload_width)
+                       for x in self.paths]
+        self.fences = []
+        self.limits = []
+        self.steps = 0
+        self.load_fences()
+
+    def __repr__(self) -> str:
+        return (f'ShardedIndex(paths={self.paths}, '
+                f'block_size={self.block_size})')
+
+    @classmethod
+    def build(cls, paths: list, **kwargs):
+        """Open the shards and write the fence pointers alongside them.
+
+        :param list paths: paths to the sorted shard files
+        :returns: index over the shards
+        :rtype: ShardedIndex
+        """
+        index = cls(paths, **kwargs)
+        index.write_fences()
+        return index
+
+    @staticmethod
+    def fence_path(path: str) -> str:
+        """Path to the fence pointer file of a shard.
+
+        :param str path: path to the shard file
+        :returns: path to the fence pointer file
+        :rtype: str
+        """
+        return f'{path}.fence.npz'
+
+    def shard_fences(self, shard: MemoryMappedSearch) -> np.ndarray:
+        """Read the first key of every block of a shard.
+
+        :param MemoryMappedSearch shard: shard to be read
+        :returns: first key of every block
+        :rtype: ndarray
+        """
+        return np.array(shard.values[::self.block_size])
+
+    def load_fences(self):
+        """Load the fence pointers, reading the shards where they are stale."""
+        self.fences = []
+        self.limits = []
+        for path, shard in zip(self.paths, self.shards):
+            fence_path = self.fence_path(path)
+            fences = None
+            if (osp.isfile(fence_path)
+                    and osp.getmtime(fence_path) >= osp.getmtime(path)):
+                with np.load(fence_path) as saved:
+                    if saved['block_size'] == self.block_size:
+                        fences = saved['fences']
+            if fences is None:
+                logger.info(f'Reading fence pointers from {path}')
+                fences = self.shard_fences(shard)
+
+            self.fences.append(fences)
+            if len(shard.values):
+                self.limits.append((fences[0], shard.values[-1]))
+            else:
+                self.limits.append(None)
+
+    def write_fences(self):
+        """Write the fence pointers of every shard alongside the shard."""
+        for path, fences in zip(self.paths, self.fences):
+            np.savez(self.fence_path(path), fences=fences,
+                     block_size=self.block_size)
+
+    def lower_bound(self, shard_idx: int, item: Union[str, int, float]) \
+            -> int:
+        """Find the lower bound of an item in a shard reading one block.
+
+        :param int shard_idx: index of the shard to be searched
+        :param item: item to be located
+        :type: str | int | float
+        :returns: lower bound insertion point for the item in the shard
+        :rtype: int
+        """
+        shard = self.shards[shard_idx]
+        block = int(np.searchsorted(self.fences[shard_idx], item))
+        if block == 0:
+            return 0
+
+        low = (block - 1) * self.block_size
+        high = min(block * self.block_size, len(shard.values))
+        shard.steps = 0
+        idx = shard.count_bound(item, low=low, high=high)
+        self.steps += shard.steps
+        return idx
+
+    def find(self, item: Union[str, int, float]) -> list:
+        """Find the first record equal to the item in every shard.
+
+        :param item: item to be found
+        :type: str | int | float
+        :returns: (shard index, record index) for every shard holding the item
+        :rtype: list
+        """
+        self.steps = 0
+        hits = []
+        for shard_idx, limits in enumerate(self.limits):
+            if limits is None or not limits[0] <= item <= limits[1]:
+                continue
+            idx = self.lower_bound(shard_idx, item)
+            if self.shards[shard_idx].values[idx] == item:
+                hits.append((shard_idx, idx))
+        return hits
+
+    def range_scan(self, low: Union[str, int, float],
+                   high: Union[str, int, float]) -> list:
+        """Locate the records with keys in the half open interval [low, high).
+
+        :param low: lowest key included
+        :type: str | int | float
+        :param high: first key excluded
+        :type: str | int | float
+        :returns: (shard index, first record index, index after the last \
+            record) for every shard holding keys in the interval
+        :rtype: list
+        """
+        self.steps = 0
+        ranges = []
+        for shard_idx, limits in enumerate(self.limits):
+            if limits is None or not (limits[0] < high and low <= limits[1]):
+                continue
+            start = self.lower_bound(shard_idx, low)
+            stop = self.lower_bound(shard_idx, high)
+            if start < stop:
+                ranges.append((shard_idx, start, stop))
+        return ranges
+
+
+class ParallelBinarySearch(BinarySearch):
+    """Batched binary search spread across a pool of processes.
+
+    :param int processes: number of worker processes, defaults to the \
+        number of CPUs
+    :param int chunks_per_process: number of query chunks handed to each \
+        worker per batch
+
+    :Attributes:
+
+    - **block**: *SharedMemory* shared memory block holding the values
+    - **pool**: *Pool* worker processes attached to the shared values
+
+    :Details:
+
+    The values are copied into a shared memory block once and every worker
+    attaches to it when the pool starts, so only the query chunks and the
+    results are pickled. Replacing the values restarts the pool with a new
+    block on the next search. Use the instance as a context manager (or
+    call close) to stop the pool and release the shared memory.
+    """
+    def __init__(self, processes: int = None, chunks_per_process: int = 4,
+                 **kwargs):
+        super(ParallelBinarySearch, self).__init__(**kwargs)
+        self.processes = processes or mp.cpu_count()
+        self.chunks_per_process = chunks_per_process
+        self.block = None
+        self.pool = None
+
+    def __repr__(self) -> str:
+        return (f'ParallelBinarySearch(item={self.item}, '
+                f'values={self.values}, processes={self.processes})')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def start(self):
+        """Copy the values into shared memory and start the worker pool."""
+        values = _as_array(self.values)
+        if values.dtype.hasobject:
+            logger.warning('Values of object type can not be shared, the '
+                           'search will run in this process.')
+            return
+
+        self.block = shared_memory.SharedMemory(create=True,
+                                                size=max(values.nbytes, 1))
+        shared = np.ndarray(values.shape, dtype=values.dtype,
+                            buffer=self.block.buf)
+        shared[:] = values
+        self._array = shared
+        self._array_source = self.values
+        self.pool = mp.Pool(processes=self.processes,
+                            initializer=_attach_values,
+                            initargs=(self.block.name, values.shape,
+                                      values.dtype.str))
+
+    def close(self):
+        """Stop the worker pool and release the shared memory."""
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+        if self.block is not None:
+            self._array = None
+            self._array_source = None
+            self.block.close()
+            self.block.unlink()
+            self.block = None
+
+    def search_many(self, items: Union[tuple, list, np.ndarray]) \
+            -> SearchResults:
+        """Search for many items across the worker pool.
+
+        :param items: items to be found
+        :type: tuple | list | ndarray
+        :returns: item indices (-1 if not found), actual number of search \
+            steps for each item, mask of the items found and maximum \
+            possible number of search steps
+        :rtype: SearchResults
+        """
+        if self.values is None:
+            self.no_values()
+            return None
+        if self.pool is not None and self._array_source is not self.values:
+            self.close()
+        if self.pool is None:
+            self.start()
+        if self.pool is None:
+            return super(ParallelBinarySearch, self).search_many(items)
+
+        items = np.asarray(items)
+        shape = items.shape
+        chunks = np.array_split(items.ravel(),
+                                self.processes * self.chunks_per_process)
+        results = self.pool.map(_probe_shared, chunks)
+        item_idx = np.concatenate([x[0] for x in results]).reshape(shape)
+        steps = np.concatenate([x[1] for x in results]).reshape(shape)
+
+        self.log_n()
+        return SearchResults(item_idx, steps, item_idx >= 0, self.max_steps)
+
+
+class LearnedIndexSearch(BaseSearch):
+    """Search a window around the position predicted by a fitted model.
+
+    :param int segments: number of equal length segments of the values, \
+        each fitted with its own regression line
+
+    :Attributes:
+
+    - **errors**: *ndarray* largest absolute position error of each segment
+    - **first_keys**: *ndarray* first value of each segment
+    - **insert_idx**: *int* index where a missing item would be inserted to \
+        keep the values sorted, None if the item was found
+    - **intercepts**: *ndarray* y-intercept of each segment regression line
+    - **limits**: *ndarray* first index and index after the last value of \
+        each segment
+    - **segments**: *int* number of segments
+    - **slopes**: *ndarray* slope of each segment regression line
+
+    :Details:
+
+    Position versus value is fitted with
+    :class:`algorithms.regression.LeastSquares` for every segment and the
+    largest prediction error is recorded. A search routes the item to its
+    segment, predicts the position and bisects only the window of the
+    recorded error around the prediction, so steps is log2 of the window
+    size rather than of the number of values. The model is refitted when
+    the values are replaced.
+    """
+    def __init__(self, segments: int = 1, **kwargs):
+        super(LearnedIndexSearch, self).__init__(**kwargs)
+        self.segments = segments
+        self.insert_idx = None
+        self._fit_source = None
+        self.errors = None
+        self.first_keys = None
+        self.intercepts = None
+        self.limits = None
+        self.slopes = None
+        if self.values is not None:
+            self.fit()
+
+    def __repr__(self) -> str:
+        return (f'LearnedIndexSearch(item={self.item}, values={self.values}, '
+                f'segments={self.segments})')
+
+    def fit(self):
+        """Fit the position of the values in every segment."""
+        self._fit_source = self.values
+        keys = _as_array(self.values).astype(np.float64)
+        positions = np.arange(keys.shape[0], dtype=np.float64)
+        segments = min(self.segments, keys.shape[0])
+
+        bounds = np.linspace(0, keys.shape[0], segments + 1).astype(np.intp)
+        self.limits = np.c_[bounds[:-1], bounds[1:]]
+        self.first_keys = keys[bounds[:-1]]
+        self.slopes = np.zeros(segments)
+        self.intercepts = np.zeros(segments)
+        self.errors = np.zeros(segments, dtype=np.intp)
+        for n, (start, stop) in enumerate(self.limits):
+            model = regression.LeastSquares(x=keys[start:stop],
+                                            y=positions[start:stop])
+            model.calc_y_intercept()
+            predicted = model.slope * model.x + model.y_intercept
+            self.slopes[n] = model.slope
+            self.intercepts[n] = model.y_intercept
+            self.errors[n] = math.ceil(np.max(np.abs(predicted - model.y)))
+
+    def window(self, item: Union[int, float]) -> Tuple[int, int, int]:
+        """Determine the segment and window of positions to be searched.
+
+        :param item: item to be located
+        :type: int | float
+        :returns: segment index, first index and index after the last \
+            index of the window
+        :rtype: tuple(int, int, int)
+        """
+        segment = int(np.searchsorted(self.first_keys, item)) - 1
+        if segment < 0:
+            return 0, 0, 0
+
+        start, stop = self.limits[segment]
+        predicted = self.slopes[segment] * item + self.intercepts[segment]
+        error = self.errors[segment] + 1
+        low = int(min(max(math.floor(predicted - error), start), stop))
+        high = int(min(max(math.ceil(predicted + error) + 1, low), stop))
+        return segment, low, high
+
+    def search(self) -> Tuple[int, int, int]:
+        """Notify the user of the item index and number of search steps.
+
+        Routing the item to a segment is not counted as a search step.
+
+        :returns: item index (None if not found), actual number of search \
+            steps and maximum possible number of search steps
+        """
+        self.steps = 0
+        self.item_idx = None
+        self.insert_idx = None
+        if self.values is None:
+            self.no_values()
+            return None
+        if self._fit_source is not self.values:
+            self.fit()
+        self.log_n()
+
+        _, low, high = self.window(self.item)
+        idx = self.count_bound(self.item, low=low, high=high)
+        if idx < len(self.values) and self.values[idx] == self.item:
+            self.item_idx = idx
+        else:
+            self.insert_idx = idx
+        return self.item_idx, self.steps, self.max_steps
@@ -0,0 +1,207 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Search Service Module
+
+.. moduleauthor:: Timothy Helton <timothy.j.helton@gmail.com>
+"""
+
+import asyncio
+from collections import deque
+import logging
+from typing import Tuple, Union
+
+import numpy as np
+
+from . import search
+
+
+logger = logging.getLogger(__name__)
+
+
+class SearchService:
+    """Asyncio front end coalescing concurrent lookups into batched searches.
+
+    :param values: all values to be searched
+    :type: str | tuple | list | iter | ndarray
+    :param float window: seconds to wait for more lookups after the first \
+        lookup of a batch arrives
+    :param int max_batch: maximum number of lookups in a batch
+    :param int history: number of recent batch sizes kept for the metrics
+
+    :Attributes:
+
+    - **batch_sizes**: *deque* sizes of the most recent batches
+    - **batches**: *int* number of batches searched
+    - **lookups**: *int* number of lookups resolved
+    - **max_batch**: *int* maximum number of lookups in a batch
+    - **max_queue_depth**: *int* largest number of lookups seen waiting
+    - **searcher**: *BinarySearch* search instance answering the batches
+    - **window**: *float* seconds to wait for more lookups per batch
+
+    :Details:
+
+    Lookups are queued on the event loop and a single worker task gathers
+    every lookup arriving within the window into one call to
+    :meth:`algorithms.search.BinarySearch.search_many`, then resolves each
+    caller's future. Use the service as an async context manager, or call
+    start and stop, inside a running event loop.
+    """
+    def __init__(self, values: Union[str, tuple, list, iter, np.ndarray],
+                 window: float = 0.001, max_batch: int = 10000,
+                 history: int = 1000):
+        self.searcher = search.BinarySearch(values=values)
+        self.window = window
+        self.max_batch = max_batch
+        self.batch_sizes = deque(maxlen=history)
+        self.batches = 0
+        self.lookups = 0
+        self.max_queue_depth = 0
+        self._batch = []
+        self._queue = None
+        self._worker = None
+
+    def __repr__(self) -> str:
+        return (f'SearchService(values={self.searcher.values}, '
+                f'window={self.window}, max_batch={self.max_batch})')
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.stop()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of lookups waiting to be batched."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        """Mean size of the most recent batches."""
+        if not self.batch_sizes:
+            return 0.0
+        return sum(self.batch_sizes) / len(self.batch_sizes)
+
+    async def start(self):
+        """Start the worker task batching the lookups."""
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self):
+        """Stop the worker task and cancel the lookups still waiting."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        while self._queue is not None and not self._queue.empty():
+            self._batch.append(self._queue.get_nowait())
+        for _, future in self._batch:
+            future.cancel()
+        self._batch = []
+
+    async def lookup(self, item: Union[str, int, float]) \
+            -> Tuple[int, int, int]:
+        """Find an item, waiting for the batch holding the lookup.
+
+        :param item: item to be found
+        :type: str | int | float
+        :returns: item index (None if not found), actual number of search \
+            steps and maximum possible number of search steps
+        """
+        if self._worker is None:
+            raise RuntimeError('The search service has not been started.')
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future))
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        return await future
+
+    async def gather_batch(self) -> list:
+        """Wait for a lookup and collect the lookups arriving in the window.
+
+        :returns: (item, future) for every lookup in the batch
+        :rtype: list
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._batch = [await self._queue.get()]
+        deadline = loop.time() + self.window
+        while len(batch) < self.max_batch:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(),
+                                                    timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    def resolve(self, batch: list):
+        """Search a batch of lookups and resolve the futures.
+
+        If the batch search fails, for example because one item can not be
+        compared with the values, every lookup is searched on its own so
+        only the failing lookups receive the exception.
+
+        :param list batch: (item, future) for every lookup in the batch
+        """
+        self.batches += 1
+        self.batch_sizes.append(len(batch))
+        self.lookups += len(batch)
+
+        try:
+            results = self.searcher.search_many([x[0] for x in batch])
+        except Exception:
+            for lookup in batch:
+                self.resolve_one(*lookup)
+            return
+
+        for n, (_, future) in enumerate(batch):
+            self.set_result(future, results, n)
+
+    def resolve_one(self, item: Union[str, int, float],
+                    future: asyncio.Future):
+        """Search a single lookup and resolve its future.
+
+        :param item: item to be found
+        :type: str | int | float
+        :param Future future: future of the lookup
+        """
+        try:
+            results = self.searcher.search_many([item])
+        except Exception as exc:
+            logger.exception(f'Search for {item!r} failed.')
+            if not future.done():
+                future.set_exception(exc)
+            return
+        self.set_result(future, results, 0)
+
+    @staticmethod
+    def set_result(future: asyncio.Future, results: search.SearchResults,
+                   n: int):
+        """Resolve a lookup future from the results of a search.
+
+        :param Future future: future of the lookup
+        :param SearchResults results: results of the search
+        :param int n: position of the lookup in the results
+        """
+        if future.done():
+            return
+        item_idx = int(results.item_idx[n]) if results.found[n] else None
+        future.set_result((item_idx, int(results.steps[n]),
+                           results.max_steps))
+
+    async def run(self):
+        """Batch and resolve lookups until cancelled."""
+        while True:
+            self.resolve(await self.gather_batch())
+            self._batch = []
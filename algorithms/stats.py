@@ -6,18 +6,442 @@
 .. moduleauthor:: Timothy Helton <timothy.j.helton@gmail.com>
 """
 
+import bisect
 from collections import namedtuple
+from functools import reduce
+import itertools
+import math
+import multiprocessing as mp
+import os.path as osp
+from typing import Tuple, Union
 
 import numpy as np
 
 
+Quartiles = namedtuple('Quartiles', ('q1', 'q2', 'q3'))
+Statistics = namedtuple('Statistics', ('count', 'mean', 'variance', 'median',
+                                       'quartiles', 'inner_quartile_range'))
+
+
+def median_positions(start: int, length: int) -> tuple:
+    """Positions of the order statistics averaged for a median.
+
+    :param int start: position of the first value
+    :param int length: number of values
+    :returns: one position for an odd length, two for an even length and \
+        none for no values
+    :rtype: tuple
+    """
+    middle = start + length // 2
+    if not length:
+        return ()
+    elif length % 2:
+        return middle,
+    return middle - 1, middle
+
+
+def quartile_positions(length: int) -> Tuple[tuple, tuple, tuple]:
+    """Positions of the order statistics defining the quartiles.
+
+    The quartiles follow the halves definition used by General: q2 is the
+    median, q1 the median of the bottom half and q3 the median of the top
+    half, where the halves exclude the median value for an odd length.
+
+    :param int length: number of values
+    :returns: order statistic positions for q1, q2 and q3
+    :rtype: tuple(tuple, tuple, tuple)
+    """
+    half = length // 2
+    return (median_positions(0, half), median_positions(0, length),
+            median_positions(length - half, half))
+
+
+def select_median(data: np.ndarray, start: int, length: int):
+    """Find the median of a segment of the data by partitioning in place.
+
+    After the call every value in the segment before the (upper) median
+    position is less than or equal to every value after it, so the halves of
+    the segment can be selected from in turn.
+
+    :param ndarray data: data set, partitioned in place
+    :param int start: position of the first value of the segment
+    :param int length: number of values in the segment
+    :returns: median of the segment, nan if the segment is empty
+    :rtype: int | float
+    """
+    positions = median_positions(0, length)
+    if not positions:
+        return np.nan
+
+    segment = data[start:start + length]
+    segment.partition(positions[-1])
+    high = segment[positions[-1]]
+    if len(positions) == 1:
+        return high
+    return (segment[:positions[-1]].max() + high) / 2
+
+
+def take_median(data: np.ndarray, positions: tuple, axis: int):
+    """Average the order statistics of a median along an axis.
+
+    :param ndarray data: data sorted (or partitioned around the positions) \
+        along the axis
+    :param tuple positions: positions averaged for the median
+    :param int axis: axis holding the values of each data set
+    :returns: median of each data set, nan if there are no positions
+    :rtype: ndarray
+    """
+    if not positions:
+        return np.full(np.delete(data.shape, axis), np.nan)[()]
+    values = [np.take(data, x, axis=axis) for x in positions]
+    if len(values) == 1:
+        return values[0]
+    return (values[0] + values[1]) / 2
+
+
+class QuantileSketch:
+    """Bounded memory sketch of the order statistics of a data stream.
+
+    :param int capacity: number of values kept at the top level of the \
+        sketch
+    :param int seed: seed for the random compaction offsets
+
+    :Attributes:
+
+    - **capacity**: *int* number of values kept at the top level
+    - **count**: *int* number of values absorbed
+    - **levels**: *list* arrays of retained values, a value at level h \
+        stands for 2**h values of the stream
+
+    :Details:
+
+    A KLL style sketch. When a level exceeds its capacity it is sorted and
+    every other value (from a random offset) is promoted to the next level
+    with twice the weight. Capacities shrink by 2/3 per level below the top,
+    so memory stays O(capacity) and the rank error is about
+    1 / capacity of the count. Until the first compaction the sketch holds
+    every value and the order statistics are exact.
+    """
+    def __init__(self, capacity: int = 1024, seed: int = None):
+        self.capacity = capacity
+        self.count = 0
+        self.levels = []
+        self._rng = np.random.default_rng(seed)
+
+    def __repr__(self):
+        return f'QuantileSketch(capacity={self.capacity}, count={self.count})'
+
+    def level_capacity(self, level: int) -> int:
+        """Number of values a level may hold before it is compacted.
+
+        :param int level: level of the sketch
+        :returns: capacity of the level
+        :rtype: int
+        """
+        depth = len(self.levels) - 1 - level
+        return max(8, int(self.capacity * (2 / 3) ** depth))
+
+    def update(self, values: np.ndarray):
+        """Absorb values into the sketch.
+
+        :param ndarray values: values of the stream
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if not values.size:
+            return
+        self.count += values.size
+        if not self.levels:
+            self.levels.append(values.copy())
+        else:
+            self.levels[0] = np.concatenate((self.levels[0], values))
+        self.compress()
+
+    def merge(self, other):
+        """Absorb the values summarized by another sketch.
+
+        :param QuantileSketch other: sketch to be merged
+        """
+        self.count += other.count
+        for level, values in enumerate(other.levels):
+            if level < len(self.levels):
+                self.levels[level] = np.concatenate((self.levels[level],
+                                                     values))
+            else:
+                self.levels.append(values.copy())
+        self.compress()
+
+    def compress(self):
+        """Compact every level holding more values than its capacity."""
+        level = 0
+        while level < len(self.levels):
+            values = self.levels[level]
+            if values.size > self.level_capacity(level):
+                values = np.sort(values)
+                keep = values[values.size - values.size % 2:]
+                promoted = values[self._rng.integers(2):values.size
+                                  - values.size % 2:2]
+                self.levels[level] = keep
+                if level + 1 == len(self.levels):
+                    self.levels.append(promoted)
+                else:
+                    self.levels[level + 1] = np.concatenate(
+                        (self.levels[level + 1], promoted))
+            level += 1
+
+    def order_statistics(self, positions: tuple) -> dict:
+        """Estimate order statistics of the stream.
+
+        :param tuple positions: order statistic positions
+        :returns: estimated value for each position
+        :rtype: dict
+        """
+        if not positions:
+            return {}
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(x.size, 2 ** n)
+                                  for n, x in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        ranks = np.cumsum(weights[order])
+        idx = np.searchsorted(ranks, positions, side='right')
+        return dict(zip(positions, values[order][idx]))
+
+    def quartiles(self) -> Quartiles:
+        """Estimate the quartiles following the General halves definition.
+
+        :returns: quartiles q1, q2 and q3
+        :rtype: Quartiles
+        """
+        positions = quartile_positions(self.count)
+        estimates = self.order_statistics(sum(positions, ()))
+        return Quartiles(*(np.mean([estimates[n] for n in x]) if x
+                           else np.nan for x in positions))
+
+
+class Summary:
+    """Mergeable summary of the statistics of a data set.
+
+    :param int capacity: top level capacity of the quantile sketch
+
+    :Attributes:
+
+    - **count**: *int* number of values summarized
+    - **m2**: *float* sum of squared deviations from the mean
+    - **mean**: *float* mean of the values
+    - **sketch**: *QuantileSketch* order statistics of the values
+
+    :Details:
+
+    Summaries are computed independently per chunk (or per worker), merged
+    in any grouping and finalized once. The count, mean and variance are
+    exact; the median and quartiles are exact while the merged sketch has
+    not been compacted and estimated afterwards. Summaries pickle and
+    convert to plain dictionaries with to_dict for other transports.
+    """
+    def __init__(self, capacity: int = 1024):
+        self.capacity = capacity
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.sketch = QuantileSketch(capacity=capacity)
+
+    def __repr__(self):
+        return f'Summary(count={self.count}, mean={self.mean})'
+
+    @classmethod
+    def from_data(cls, data: np.ndarray, capacity: int = 1024):
+        """Summarize a data set.
+
+        :param ndarray data: data set
+        :param int capacity: top level capacity of the quantile sketch
+        :returns: summary of the data
+        :rtype: Summary
+        """
+        summary = cls(capacity=capacity)
+        summary.update(data)
+        return summary
+
+    @classmethod
+    def from_dict(cls, state: dict):
+        """Rebuild a summary from the output of to_dict.
+
+        :param dict state: summary state
+        :returns: summary
+        :rtype: Summary
+        """
+        summary = cls(capacity=state['capacity'])
+        summary.count = state['count']
+        summary.mean = state['mean']
+        summary.m2 = state['m2']
+        summary.sketch.count = state['count']
+        summary.sketch.levels = [np.array(x, dtype=np.float64)
+                                 for x in state['levels']]
+        return summary
+
+    def to_dict(self) -> dict:
+        """Convert the summary to builtin types.
+
+        :returns: summary state
+        :rtype: dict
+        """
+        return {'capacity': self.capacity,
+                'count': self.count,
+                'mean': float(self.mean),
+                'm2': float(self.m2),
+                'levels': [x.tolist() for x in self.sketch.levels]}
+
+    def combine(self, count: int, mean: float, m2: float):
+        """Combine the moments of another set of values (Chan et al.).
+
+        :param int count: number of values
+        :param float mean: mean of the values
+        :param float m2: sum of squared deviations from the mean
+        """
+        total = self.count + count
+        if not total:
+            return
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+
+    def update(self, chunk: np.ndarray):
+        """Absorb a chunk of values.
+
+        :param ndarray chunk: values to be summarized
+        """
+        chunk = np.asarray(chunk, dtype=np.float64).ravel()
+        if not chunk.size:
+            return
+        chunk_mean = chunk.mean()
+        self.combine(chunk.size, chunk_mean,
+                     np.square(chunk - chunk_mean).sum())
+        self.sketch.update(chunk)
+
+    def merge(self, other):
+        """Absorb another summary.
+
+        :param Summary other: summary to be merged
+        :returns: this summary
+        :rtype: Summary
+        """
+        self.combine(other.count, other.mean, other.m2)
+        self.sketch.merge(other.sketch)
+        return self
+
+    def finalize(self) -> Statistics:
+        """Calculate the statistics of the summarized values.
+
+        :returns: count, mean, variance, median, quartiles and quartile range
+        :rtype: Statistics
+        """
+        if not self.count:
+            return Statistics(0, np.nan, np.nan, np.nan,
+                              Quartiles(np.nan, np.nan, np.nan), np.nan)
+        quartiles = self.sketch.quartiles()
+        return Statistics(self.count, self.mean, self.m2 / self.count,
+                          quartiles.q2, quartiles,
+                          quartiles.q3 - quartiles.q1)
+
+
+def summarize(source: Union[str, np.ndarray], capacity: int = 1024,
+              chunk_size: int = 2 ** 20) -> Summary:
+    """Summarize an array or a .npy / raw float64 file chunk by chunk.
+
+    :param source: data set or path to a file holding one
+    :type: str | ndarray
+    :param int capacity: top level capacity of the quantile sketch
+    :param int chunk_size: number of values read at a time
+    :returns: summary of the data
+    :rtype: Summary
+    """
+    if isinstance(source, str):
+        if osp.splitext(source)[1] == '.npy':
+            source = np.load(source, mmap_mode='r')
+        else:
+            source = np.memmap(source, dtype=np.float64, mode='r')
+    source = source.ravel()
+
+    summary = Summary(capacity=capacity)
+    for start in range(0, source.shape[0], chunk_size):
+        summary.update(source[start:start + chunk_size])
+    return summary
+
+
+def parallel_summary(sources: Union[list, np.ndarray], processes: int = None,
+                     capacity: int = 1024) -> Summary:
+    """Summarize a large array or a list of files across a process pool.
+
+    :param sources: data set (split into one part per process) or paths to \
+        .npy / raw float64 files
+    :type: list | ndarray
+    :param int processes: number of worker processes, defaults to the \
+        number of CPUs
+    :param int capacity: top level capacity of the quantile sketches
+    :returns: merged summary of every source
+    :rtype: Summary
+    """
+    processes = processes or mp.cpu_count()
+    if isinstance(sources, np.ndarray):
+        sources = np.array_split(sources.ravel(), processes)
+    with mp.Pool(processes=processes) as pool:
+        summaries = pool.starmap(summarize, [(x, capacity) for x in sources])
+    return reduce(Summary.merge, summaries, Summary(capacity=capacity))
+
+
+def lazy_property(name: str, method: str, doc: str) -> property:
+    """Property calculating its value from the data on first access.
+
+    :param str name: attribute name, the value is stored as _name
+    :param str method: name of the method calculating the value
+    :param str doc: property docstring
+    :returns: property reading and writing the stored value
+    :rtype: property
+    """
+    attribute = f'_{name}'
+
+    def getter(self):
+        if getattr(self, attribute) is None and self.data is not None:
+            getattr(self, method)()
+        return getattr(self, attribute)
+
+    def setter(self, value):
+        setattr(self, attribute, value)
+
+    return property(getter, setter, doc=doc)
+
+
+def halves(data: np.ndarray, axis: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Split sorted (or median partitioned) data into its halves.
+
+    The median value of an odd length is excluded from both halves.
+
+    :param ndarray data: data set
+    :param int axis: axis holding the values of each data set
+    :returns: views of the bottom and top halves
+    :rtype: tuple(ndarray, ndarray)
+    """
+    length = data.shape[axis]
+    low = [slice(None)] * data.ndim
+    high = [slice(None)] * data.ndim
+    low[axis] = slice(0, length // 2)
+    high[axis] = slice(length - length // 2, length)
+    return data[tuple(low)], data[tuple(high)]
+
+
 class General:
     """Class to calculate general statistical properties of a data set.
 
     :param ndarray data: data set
+    :param int capacity: top level capacity of the quantile sketch used by \
+        update
+    :param int axis: axis of a multidimensional data set holding the values \
+        of each series
 
     :Attributes:
 
+    - **axis**: *int* axis holding the values of each series, None for a \
+        one dimensional data set
+    - **count**: *int* number of values absorbed by update
     - **data**: *ndarray* initial data set
     - **mean**: *float* mean of data
     - **median**: *float* median of data
@@ -25,61 +449,562 @@ class General:
     - **median_high**: *ndarray* top half values of data (top 50%)
     - **quartiles**: *namedtuple* quartiles q1: 25%, q2: 50% (median), q3:75%
     - **quartile_range**: *float* middle 50% of data (q3 - q1)
+    - **sorted_data**: *ndarray* sorted copy of the data
+    - **summary**: *Summary* mergeable summary of the values absorbed by \
+        update
+    - **variance**: *float* population variance of the values absorbed by \
+        update
+
+    :Details:
+
+    The data is sorted once, on first use, and the sorted copy is shared by
+    every statistic. The statistics are calculated lazily when first read
+    and kept until the data attribute is replaced, so repeated queries of
+    the same data set cost O(1). The calc methods recalculate explicitly.
+
+    calc_median and calc_quartiles accept selection=True to find the needed
+    order statistics by partitioning one copy of the data (O(n)) instead of
+    sorting it (O(n log n)) when the sorted copy does not exist yet. The
+    values match the sorted halves definition; median_low and median_high
+    then hold the halves unsorted.
+
+    update absorbs a stream of chunks in constant memory: count, mean and
+    variance are exact (Chan/Welford pairwise update) and the median,
+    quartiles and quartile range are estimated from a QuantileSketch, both
+    kept by a Summary.
+
+    Given an axis, the data (a multidimensional array or a list of equal
+    length arrays) holds one series per position along the other axes and
+    every statistic is calculated for all series in one vectorized call,
+    producing arrays instead of scalars.
     """
-    def __init__(self, data=None):
+    mean = lazy_property('mean', 'calc_mean', 'Mean of the data.')
+    median = lazy_property('median', 'calc_median', 'Median of the data.')
+    median_low = lazy_property('median_low', 'calc_median',
+                               'Bottom half values of the data.')
+    median_high = lazy_property('median_high', 'calc_median',
+                                'Top half values of the data.')
+    quartiles = lazy_property('quartiles', 'calc_quartiles',
+                              'Quartiles q1, q2 (median) and q3.')
+    inner_quartile_range = lazy_property('inner_quartile_range',
+                                         'calc_quartiles',
+                                         'Middle 50% of the data (q3 - q1).')
+
+    def __init__(self, data=None, capacity: int = 1024, axis: int = None):
+        self.axis = axis
+        self.capacity = capacity
+        self.count = 0
+        self.summary = None
+        self.variance = None
         self.data = data
-        self.mean = None
-        self.median = None
-        self.median_low = None
-        self.median_high = None
-        self.quartiles = None
-        self.inner_quartile_range = None
 
     def __repr__(self):
         return f'General(data={self.data})'
 
+    @property
+    def data(self):
+        """Data set, replacing it discards every calculated statistic."""
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        if data is not None and self.axis is not None:
+            data = np.asarray(data)
+        self._data = data
+        self.clear()
+
+    @property
+    def sorted_data(self) -> np.ndarray:
+        """Sorted copy of the data, created on first use."""
+        if self._sorted is None and self.data is not None:
+            self._sorted = np.sort(self.data, axis=self._value_axis)
+        return self._sorted
+
+    @property
+    def _value_axis(self) -> int:
+        """Axis holding the values of each series."""
+        return 0 if self.axis is None else self.axis
+
+    def clear(self):
+        """Discard the sorted copy and every calculated statistic."""
+        self._sorted = None
+        self._mean = None
+        self._median = None
+        self._median_low = None
+        self._median_high = None
+        self._quartiles = None
+        self._inner_quartile_range = None
+
     def calc_mean(self):
         """Calculate the mean of the data."""
+        if self.axis is not None:
+            self.mean = (self.data.sum(axis=self.axis)
+                         / self.data.shape[self.axis])
+            return
         self.mean = self.data.sum() / self.data.shape
 
-    def calc_median(self):
-        """Calculate the median of the data."""
-        if self.data.shape[0] is 1:
-            self.median = self.data[0]
-            self.median_low = None
-            self.median_high = None
-
-        data = np.sort(self.data.copy())
-        length = data.shape[0]
-        middle = length // 2
-        if length % 2 is 0:
-            self.median = data[middle - 1: middle + 1].sum() / 2
-            self.median_low = data[:middle]
-            self.median_high = data[middle:]
+    def calc_median(self, selection: bool = False):
+        """Calculate the median of the data.
+
+        :param bool selection: if True partition the data instead of sorting
+        """
+        axis = self._value_axis
+        positions = median_positions(0, self.data.shape[axis])
+        if selection and self._sorted is None:
+            if self.axis is None:
+                data = np.array(self.data)
+                self.median = select_median(data, 0, data.shape[0])
+                self.median_low, self.median_high = halves(data, axis)
+                return
+            data = self.sorted_axis(positions)
+        else:
+            data = self.sorted_data
+
+        self.median = take_median(data, positions, axis)
+        self.median_low, self.median_high = halves(data, axis)
+
+    def calc_quartiles(self, selection: bool = False):
+        """Calculate the quartiles q1, q2, q3 and the quartile range.
+
+        :param bool selection: if True partition the data once around the \
+            needed order statistics instead of sorting
+        """
+        axis = self._value_axis
+        positions = quartile_positions(self.data.shape[axis])
+        if selection and self._sorted is None:
+            if self.axis is None:
+                self.calc_median(selection=True)
+                half = self.median_low.shape[0]
+                q1 = select_median(self.median_low, 0, half)
+                q3 = select_median(self.median_high, 0, half)
+                self.quartiles = Quartiles(q1, self.median, q3)
+                self.inner_quartile_range = q3 - q1
+                return
+            data = self.sorted_axis(sum(positions, ()))
         else:
-            self.median = data[middle]
-            self.median_low = data[:middle]
-            self.median_high = data[middle + 1:]
+            data = self.sorted_data
+
+        q1, q2, q3 = (take_median(data, x, axis) for x in positions)
+        self.median = q2
+        self.quartiles = Quartiles(q1, q2, q3)
+        self.inner_quartile_range = q3 - q1
+
+    def sorted_axis(self, positions: tuple = None) -> np.ndarray:
+        """Sort every series, or partition it around order statistics.
+
+        :param tuple positions: order statistic positions to partition \
+            around, if None the cached sorted copy is returned
+        :returns: data sorted or partitioned along the axis
+        :rtype: ndarray
+        """
+        if positions is None:
+            return self.sorted_data
+        positions = sorted(set(positions))
+        if not positions:
+            return np.array(self.data)
+        return np.partition(self.data, positions, axis=self._value_axis)
+
+    def update(self, chunk: np.ndarray):
+        """Absorb a chunk of a data stream.
+
+        :param ndarray chunk: values of the stream
+        """
+        if self.summary is None:
+            self.summary = Summary(capacity=self.capacity)
+        self.summary.update(chunk)
+        if not self.summary.count:
+            return
+
+        statistics = self.summary.finalize()
+        self.count = statistics.count
+        self.mean = statistics.mean
+        self.variance = statistics.variance
+        self.median = statistics.median
+        self.quartiles = statistics.quartiles
+        self.inner_quartile_range = statistics.inner_quartile_range
+
+
+class SortedBlocks:
+    """Sorted multiset held in blocks of bounded size.
+
+    :param list values: initial values
+    :param int load: target number of values in each block
+
+    :Attributes:
+
+    - **blocks**: *list* sorted blocks, every value of a block is no larger \
+        than the values of the next block
+    - **lengths**: *list* number of values in each block
+    - **load**: *int* target number of values in each block
+    - **maxes**: *list* largest value of each block
+
+    :Details:
+
+    add and remove bisect the block maxima and then one block, and select
+    sums the block lengths. With a load proportional to sqrt(n) every
+    operation costs O(sqrt n) element moves and O(log n) comparisons,
+    instead of the O(n) tail shift of a single sorted list. Blocks are
+    split above twice the load and merged with a neighbour below half of
+    it.
+    """
+    def __init__(self, values: list, load: int):
+        values = sorted(values)
+        self.load = load
+        self.blocks = [values[x:x + load]
+                       for x in range(0, len(values), load)] or [[]]
+        self.lengths = [len(x) for x in self.blocks]
+        self.maxes = [x[-1] if x else None for x in self.blocks]
+
+    def __repr__(self):
+        return f'SortedBlocks(load={self.load}, size={sum(self.lengths)})'
+
+    def add(self, value: float):
+        """Insert a value.
+
+        :param float value: value to be inserted
+        """
+        if self.maxes[-1] is None:
+            idx = 0
+        else:
+            idx = min(bisect.bisect_left(self.maxes, value),
+                      len(self.blocks) - 1)
+        block = self.blocks[idx]
+        bisect.insort(block, value)
+        self.maxes[idx] = block[-1]
+        self.lengths[idx] += 1
+        if self.lengths[idx] > 2 * self.load:
+            self.reblock(idx, block)
+
+    def remove(self, value: float):
+        """Remove one occurrence of a value present in the multiset.
+
+        :param float value: value to be removed
+        """
+        idx = bisect.bisect_left(self.maxes, value)
+        block = self.blocks[idx]
+        del block[bisect.bisect_left(block, value)]
+        self.lengths[idx] -= 1
+        if len(self.blocks) > 1 and self.lengths[idx] < self.load // 2:
+            if idx == len(self.blocks) - 1:
+                idx -= 1
+            self.reblock(idx, self.blocks[idx] + self.blocks[idx + 1], 2)
+        elif block:
+            self.maxes[idx] = block[-1]
+        else:
+            self.maxes[idx] = None
+
+    def reblock(self, idx: int, values: list, count: int = 1):
+        """Replace blocks with sorted values split into blocks of the load.
+
+        :param int idx: index of the first block replaced
+        :param list values: sorted values of the replaced blocks
+        :param int count: number of blocks replaced
+        """
+        size = len(values)
+        parts = max(1, round(size / self.load))
+        bounds = [size * x // parts for x in range(parts + 1)]
+        blocks = [values[a:b] for a, b in zip(bounds, bounds[1:])]
+        self.blocks[idx:idx + count] = blocks
+        self.lengths[idx:idx + count] = [len(x) for x in blocks]
+        self.maxes[idx:idx + count] = [x[-1] for x in blocks]
+
+    def select(self, positions: list) -> list:
+        """Find order statistics.
+
+        :param list positions: order statistic positions
+        :returns: value at each position
+        :rtype: list
+        """
+        ends = list(itertools.accumulate(self.lengths))
+        results = []
+        for position in positions:
+            idx = bisect.bisect_right(ends, position)
+            start = ends[idx - 1] if idx else 0
+            results.append(self.blocks[idx][position - start])
+        return results
+
+
+class Rolling:
+    """Rolling window statistics of a series.
+
+    :param ndarray data: series
+    :param int window: number of values in each window
+
+    :Attributes:
+
+    - **data**: *ndarray* series
+    - **inner_quartile_range**: *ndarray* q3 - q1 of each window
+    - **mean**: *ndarray* mean of each window
+    - **median**: *ndarray* median of each window
+    - **q1**: *ndarray* first quartile of each window
+    - **q3**: *ndarray* third quartile of each window
+    - **window**: *int* number of values in each window
+
+    :Details:
+
+    Result arrays hold one value per complete window (len(data) - window + 1
+    values), the first for the window ending at index window - 1. The mean
+    comes from a cumulative sum. The order statistics come from one sorted
+    window held in SortedBlocks and maintained incrementally: each step
+    removes the leaving value and inserts the entering one with O(sqrt w)
+    element moves, and reads the order statistics of the General halves
+    definition by position. As in numpy, a window holding NaN has NaN order
+    statistics.
+    """
+    def __init__(self, data: np.ndarray = None, window: int = None):
+        self.data = data
+        self.window = window
+        self.mean = None
+        self.median = None
+        self.q1 = None
+        self.q3 = None
+        self.inner_quartile_range = None
+
+    def __repr__(self):
+        return f'Rolling(data={self.data}, window={self.window})'
+
+    def calc_mean(self):
+        """Calculate the mean of each window."""
+        data = np.asarray(self.data, dtype=np.float64)
+        totals = np.cumsum(np.r_[0.0, data - data[0]])
+        self.mean = ((totals[self.window:] - totals[:-self.window])
+                     / self.window + data[0])
 
     def calc_quartiles(self):
-        """Calculate the quartiles q1, q2, q3 and the quartile range."""
-        Quartiles = namedtuple('Quartiles', ('q1', 'q2', 'q3'))
-        original_data = self.data
+        """Calculate the median, quartiles and quartile range of each window.
+        """
+        data = np.asarray(self.data).tolist()
+        steps = max(len(data) - self.window + 1, 0)
+        positions = quartile_positions(self.window)
+        flat = sorted(set(sum(positions, ())))
+
+        nan = [x != x for x in data]
+        window = SortedBlocks([x for x, y in zip(data[:self.window], nan)
+                               if not y],
+                              load=max(32, 4 * math.isqrt(self.window)))
+        missing = sum(nan[:self.window])
+        rows = []
+        for step in range(steps):
+            if step:
+                leaving = step - 1
+                entering = step + self.window - 1
+                if nan[leaving]:
+                    missing -= 1
+                else:
+                    window.remove(data[leaving])
+                if nan[entering]:
+                    missing += 1
+                else:
+                    window.add(data[entering])
+            rows.append([np.nan] * len(flat) if missing
+                        else window.select(flat))
+
+        order_statistics = np.array(rows, dtype=np.float64).reshape(steps,
+                                                                    len(flat))
+        results = np.full((3, steps), np.nan)
+        for n, quartile in enumerate(positions):
+            if quartile:
+                columns = [flat.index(x) for x in quartile]
+                results[n] = order_statistics[:, columns].mean(axis=1)
 
-        self.calc_median()
-        q2 = self.median
-        low_array = self.median_low
-        high_array = self.median_high
+        self.q1, self.median, self.q3 = results
+        self.inner_quartile_range = self.q3 - self.q1
 
-        self.data = low_array
-        self.calc_median()
-        q1 = self.median
+    def calc(self):
+        """Calculate every rolling statistic."""
+        self.calc_mean()
+        self.calc_quartiles()
 
-        self.data = high_array
-        self.calc_median()
-        q3 = self.median
 
+class OutOfCore:
+    """Statistics of a data set larger than memory held in a file.
+
+    :param str path: path to a .npy file or a raw binary file
+    :param dtype: data type of the values in a raw binary file
+    :type: str | dtype
+    :param int memory_budget: bytes of memory used for values read from the \
+        file at any time
+    :param int bins: number of histogram bins per refinement pass
+
+    :Attributes:
+
+    - **bins**: *int* number of histogram bins per refinement pass
+    - **data**: *memmap* read only mapped values
+    - **inner_quartile_range**: *float* q3 - q1
+    - **mean**: *float* mean of the data
+    - **median**: *float* median of the data
+    - **memory_budget**: *int* bytes of memory used for values read from \
+        the file at any time
+    - **passes**: *int* number of passes over the file made by the last \
+        order statistic calculation
+    - **path**: *str* path to the file
+    - **quartiles**: *namedtuple* quartiles q1: 25%, q2: 50% (median), q3:75%
+
+    :Details:
+
+    The file is memory mapped and read in chunks. The mean is accumulated
+    exactly in one pass. Order statistics are found by histogram
+    refinement: every pass counts the values falling in the bins of the
+    interval known to hold each order statistic and narrows the interval to
+    a single bin, until the values left in the interval fit in the memory
+    budget and are selected directly. Values are compared as float64.
+    Statistics are calculated on first access, as with General, using the
+    same median and quartile positions.
+    """
+    mean = lazy_property('mean', 'calc_mean', 'Mean of the data.')
+    median = lazy_property('median', 'calc_median', 'Median of the data.')
+    quartiles = lazy_property('quartiles', 'calc_quartiles',
+                              'Quartiles of the data.')
+    inner_quartile_range = lazy_property('inner_quartile_range',
+                                         'calc_quartiles',
+                                         'Quartile range of the data.')
+
+    def __init__(self, path: str, dtype='<f8', memory_budget: int = 2 ** 26,
+                 bins: int = 1024):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.memory_budget = memory_budget
+        self.bins = bins
+        self.passes = 0
+        self.data = self.open()
+        self.clear()
+
+    def __repr__(self):
+        return f'OutOfCore(path={self.path})'
+
+    def clear(self):
+        """Discard every calculated statistic."""
+        self._limits = None
+        self._mean = None
+        self._median = None
+        self._quartiles = None
+        self._inner_quartile_range = None
+
+    def open(self) -> np.ndarray:
+        """Memory map the values in the file.
+
+        :returns: read only mapped values
+        :rtype: memmap
+        """
+        if osp.splitext(self.path)[1] == '.npy':
+            return np.load(self.path, mmap_mode='r').ravel()
+        return np.memmap(self.path, dtype=self.dtype, mode='r')
+
+    @property
+    def chunk_size(self) -> int:
+        """Number of values read from the file at a time."""
+        return max(1, self.memory_budget // 4 // 8)
+
+    def chunks(self):
+        """Read the values in chunks.
+
+        :returns: float64 chunks of the values
+        :rtype: generator
+        """
+        for start in range(0, self.data.shape[0], self.chunk_size):
+            yield np.asarray(self.data[start:start + self.chunk_size],
+                             dtype=np.float64)
+
+    def calc_mean(self):
+        """Calculate the mean, minimum and maximum of the data in one pass."""
+        total = 0.0
+        minimum = np.inf
+        maximum = -np.inf
+        for chunk in self.chunks():
+            total += chunk.sum()
+            minimum = min(minimum, chunk.min())
+            maximum = max(maximum, chunk.max())
+        self.mean = total / self.data.shape[0]
+        self._limits = (minimum, maximum)
+
+    def order_statistics(self, positions: tuple) -> dict:
+        """Find order statistics within the memory budget.
+
+        :param tuple positions: order statistic positions
+        :returns: value for each position
+        :rtype: dict
+        """
+        positions = sorted(set(positions))
+        if not positions:
+            return {}
+        if self._limits is None:
+            self.calc_mean()
+        self.passes = 1
+
+        capacity = max(1, self.memory_budget // 2 // 8 // len(positions))
+        low, high = self._limits
+        # half open interval holding each order statistic, count of values
+        # below the interval and count of values in the interval
+        state = {x: [low, np.nextafter(high, np.inf), 0, self.data.shape[0]]
+                 for x in positions}
+        results = {}
+        while len(results) < len(positions):
+            refine = [x for x in positions if x not in results
+                      and state[x][3] > capacity]
+            for position in refine:
+                low, high = state[position][:2]
+                if np.nextafter(low, np.inf) >= high:
+                    results[position] = low
+            refine = [x for x in refine if x not in results]
+            collect = [x for x in positions if x not in results
+                       and x not in refine]
+            if not refine and not collect:
+                break
+
+            # positions sharing an interval share the work of each pass
+            refine_groups = {tuple(state[x][:2]) for x in refine}
+            collect_groups = {tuple(state[x][:2]) for x in collect}
+            edges = {x: np.linspace(*x, self.bins + 1) for x in refine_groups}
+            counts = {x: np.zeros(self.bins, dtype=np.int64)
+                      for x in refine_groups}
+            values = {x: [] for x in collect_groups}
+            self.passes += 1
+            for chunk in self.chunks():
+                for group in refine_groups | collect_groups:
+                    inside = chunk[(chunk >= group[0]) & (chunk < group[1])]
+                    if group in values:
+                        values[group].append(inside)
+                    if group in counts:
+                        bins = np.searchsorted(edges[group], inside,
+                                               side='right') - 1
+                        counts[group] += np.bincount(bins,
+                                                     minlength=self.bins)
+
+            for position in refine:
+                group = tuple(state[position][:2])
+                cumulative = state[position][2] + np.cumsum(counts[group])
+                idx = int(np.searchsorted(cumulative, position, side='right'))
+                below = cumulative[idx - 1] if idx else state[position][2]
+                state[position] = [edges[group][idx], edges[group][idx + 1],
+                                   below, counts[group][idx]]
+            for group in collect_groups:
+                inside = np.concatenate(values[group])
+                for position in collect:
+                    if tuple(state[position][:2]) == group:
+                        k = position - state[position][2]
+                        results[position] = np.partition(inside, k)[k]
+        return results
+
+    def calc_median(self, selection: bool = False):
+        """Calculate the median of the data.
+
+        :param bool selection: accepted for compatibility with General, the \
+            median is always selected by histogram refinement
+        """
+        positions = median_positions(0, self.data.shape[0])
+        values = self.order_statistics(positions)
+        self.median = np.mean([values[x] for x in positions])
+
+    def calc_quartiles(self, selection: bool = False):
+        """Calculate the quartiles q1, q2, q3 and the quartile range.
+
+        :param bool selection: accepted for compatibility with General, the \
+            quartiles are always selected by histogram refinement
+        """
+        positions = quartile_positions(self.data.shape[0])
+        values = self.order_statistics(sum(positions, ()))
+        q1, q2, q3 = (np.mean([values[n] for n in x]) if x else np.nan
+                      for x in positions)
+        self.median = q2
         self.quartiles = Quartiles(q1, q2, q3)
         self.inner_quartile_range = q3 - q1
-
-        self.data = original_data
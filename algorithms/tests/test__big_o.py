@@ -0,0 +1,76 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Big O Test Module
+
+.. moduleauthor:: Timothy Helton <timothy.j.helton@gmail.com>
+"""
+
+import numpy as np
+import pytest
+
+from algorithms import big_o
+
+
+sizes = big_o.geometric_sizes(2 ** 6, 2 ** 20, 12)
+noise = 1 + 0.02 * np.random.RandomState(0).standard_normal(sizes.size)
+
+
+###############################################################################
+# Test big_o DataFrame
+def test__big_o_curves():
+    assert list(big_o.big_o.columns) == ['O(n)', 'O(log n)', 'O(n log n)',
+                                         'O($n^2$)', 'O(n!)']
+    assert big_o.big_o['O(n!)'].iloc[-1] == pytest.approx(24)
+
+
+# Test geometric_sizes()
+def test__geometric_sizes():
+    assert list(big_o.geometric_sizes(1, 1000, 4)) == [1, 10, 100, 1000]
+
+
+# Test fit_models() and select()
+timings = {
+    'constant': (3e-6 * np.ones(sizes.size), 'O(1)'),
+    'log': (2e-7 * np.log(sizes) + 1e-6, 'O(log n)'),
+    'linear': (5e-9 * sizes + 1e-5, 'O(n)'),
+    'n_log_n': (4e-9 * sizes * np.log(sizes) + 1e-5, 'O(n log n)'),
+    'quadratic': (1e-12 * np.square(sizes) + 1e-4, 'O($n^2$)'),
+}
+
+
+@pytest.mark.parametrize('times, expected',
+                         list(timings.values()),
+                         ids=list(timings.keys()))
+def test__select(times, expected):
+    best = big_o.select(big_o.fit_models(sizes, times * noise))
+    assert best.model == expected
+
+
+def test__fit_models_constants():
+    fits = big_o.fit_models(sizes, 5e-9 * sizes + 1e-5)
+    best = fits[0]
+    assert best.slope == pytest.approx(5e-9)
+    assert best.intercept == pytest.approx(1e-5)
+    assert best.residual == pytest.approx(0, abs=1e-9)
+    assert len(fits) == len(big_o.models)
+
+
+def test__select_tolerance():
+    fits = big_o.fit_models(sizes, 2e-7 * np.log(sizes) + 1e-6)
+    assert big_o.select(fits, tolerance=1).model == 'O(1)'
+
+
+# Test measure() and estimate()
+def test__measure():
+    calls = []
+    times = big_o.measure(calls.append, sizes=[1, 2],
+                          setup=lambda n: n * 10, number=2, repeat=3)
+    assert times.shape == (2, )
+    assert calls == [10] * 6 + [20] * 6
+
+
+def test__estimate(monkeypatch):
+    monkeypatch.setattr(big_o, 'measure',
+                        lambda func, sizes, setup, **kwargs: 1e-8 * sizes)
+    assert big_o.estimate(None, sizes=sizes).model == 'O(n)'
@@ -0,0 +1,55 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Package Import Test Module
+
+.. moduleauthor:: Timothy Helton <timothy.j.helton@gmail.com>
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import algorithms
+
+
+heavy_modules = ('matplotlib', 'pandas', 'scipy', 'seaborn')
+
+
+def loaded_modules(statement):
+    check = (f'{statement}; import sys; '
+             f'print(" ".join(x for x in {heavy_modules!r} '
+             f'if x in sys.modules))')
+    output = subprocess.run([sys.executable, '-c', check],
+                            stdout=subprocess.PIPE, check=True)
+    return output.stdout.decode().split()
+
+
+###############################################################################
+# Test lazy package imports
+lazy_imports = {
+    'package': 'import algorithms',
+    'big_o': 'import algorithms; algorithms.big_o',
+    'search': 'import algorithms; algorithms.search',
+    'stats': 'import algorithms; algorithms.stats',
+    'regression': 'import algorithms; algorithms.regression',
+    'search_service': 'import algorithms; algorithms.search_service',
+}
+
+
+@pytest.mark.parametrize('statement',
+                         list(lazy_imports.values()),
+                         ids=list(lazy_imports.keys()))
+def test__lazy_imports(statement):
+    assert loaded_modules(statement) == []
+
+
+def test__package_submodules():
+    assert algorithms.stats.General is not None
+    assert 'search' in dir(algorithms)
+
+
+def test__package_missing_attribute():
+    with pytest.raises(AttributeError):
+        algorithms.missing
@@ -63,3 +63,322 @@ def test__leastsquares_plot_data():
     inst = regression.LeastSquares(x=np.arange(5), y=np.arange(5))
     print(inst.check_values())
     inst.plot_data()
+
+
+plot_modes = {
+    'scatter': {'mode': 'scatter'},
+    'downsample': {'mode': 'scatter', 'max_points': 100},
+    'hexbin': {'mode': 'hexbin', 'gridsize': 20},
+    'hist2d': {'mode': 'hist2d', 'gridsize': 20},
+}
+
+
+@pytest.mark.parametrize('kwargs', list(plot_modes.values()),
+                         ids=list(plot_modes.keys()))
+def test__leastsquares_plot_data_save(tmp_path, kwargs):
+    import matplotlib.pyplot as plt
+
+    figures = plt.get_fignums()
+    rng = np.random.RandomState(3)
+    x_values = rng.standard_normal(5000)
+    inst = regression.LeastSquares(x=x_values, y=2 * x_values + 1)
+    save_name = tmp_path / 'plot.png'
+    inst.plot_data(save_name=str(save_name), **kwargs)
+    assert save_name.stat().st_size
+    assert plt.get_fignums() == figures
+
+
+# Test save_plots()
+def test__save_plots(tmp_path):
+    regressions = [regression.LeastSquares(x=np.arange(20), y=np.arange(20)
+                                           * slope) for slope in range(3)]
+    names = [str(tmp_path / f'{n}.png') for n in range(3)]
+    regression.save_plots(regressions, names, mode='hexbin', dpi=50)
+    assert sorted(p.name for p in tmp_path.iterdir()) == \
+        ['0.png', '1.png', '2.png']
+
+
+# Test LeastSquares.fit()
+fit = dict(calc_slope, **{
+    'zero_x': ({'x': np.ones(3), 'y': np.arange(3)}, 0),
+    'noisy': ({'x': np.arange(50) * 0.1,
+               'y': np.random.RandomState(0).standard_normal(50)}, None),
+})
+
+
+@pytest.mark.parametrize('kwargs, expected',
+                         list(fit.values()),
+                         ids=list(fit.keys()))
+def test__leastsquares_fit(kwargs, expected):
+    reference = regression.LeastSquares(**kwargs)
+    reference.calc_y_intercept()
+    inst = regression.LeastSquares(**kwargs)
+    inst.fit()
+    assert inst.slope == pytest.approx(reference.slope)
+    assert inst.y_intercept == pytest.approx(reference.y_intercept)
+    if expected is not None:
+        assert inst.slope == expected
+
+
+# Test LeastSquares.partial_fit() and LeastSquares.merge()
+constant_x = {'chunk_3': 3, 'chunk_77': 77, 'chunk_333': 333}
+
+
+@pytest.mark.parametrize('size', list(constant_x.values()),
+                         ids=list(constant_x.keys()))
+def test__leastsquares_constant_x_chunks(size):
+    x_values = np.full(1000, 0.1)
+    y_values = np.arange(1000.0)
+    stream = regression.LeastSquares()
+    merged = regression.LeastSquares()
+    for start in range(0, 1000, size):
+        chunk = slice(start, start + size)
+        stream.partial_fit(x_values[chunk], y_values[chunk])
+        worker = regression.LeastSquares(x=x_values[chunk],
+                                         y=y_values[chunk])
+        worker.fit()
+        merged.merge(worker)
+    for inst in (stream, merged):
+        assert inst.slope == 0
+        assert np.isnan(inst.r)
+        assert inst.y_intercept == pytest.approx(499.5)
+
+
+def test__leastsquares_small_spread():
+    x_values = 1.6e9 + np.arange(10.0)
+    inst = regression.LeastSquares(x=x_values, y=2 * x_values)
+    inst.fit()
+    assert inst.slope == pytest.approx(2)
+
+
+def test__leastsquares_partial_fit_merge():
+    rng = np.random.RandomState(1)
+    x_values = rng.uniform(0, 10, 1000)
+    y_values = 3 * x_values - 2 + rng.standard_normal(1000)
+    reference = regression.LeastSquares(x=x_values, y=y_values)
+    reference.calc_y_intercept()
+
+    stream = regression.LeastSquares()
+    workers = [regression.LeastSquares() for _ in range(3)]
+    for n, (x_chunk, y_chunk) in enumerate(zip(np.array_split(x_values, 9),
+                                               np.array_split(y_values, 9))):
+        stream.partial_fit(x_chunk, y_chunk)
+        workers[n % 3].partial_fit(x_chunk, y_chunk)
+    merged = regression.LeastSquares()
+    for worker in workers:
+        merged.merge(worker)
+
+    for inst in (stream, merged):
+        assert inst.statistics.count == 1000
+        assert inst.slope == pytest.approx(reference.slope)
+        assert inst.y_intercept == pytest.approx(reference.y_intercept)
+        assert inst.r == pytest.approx(np.corrcoef(x_values, y_values)[1, 0])
+
+
+###############################################################################
+# Test RecursiveLeastSquares Class
+def exact_fit(points):
+    x_values, y_values = zip(*points)
+    inst = regression.LeastSquares(x=np.array(x_values), y=np.array(y_values))
+    inst.calc_y_intercept()
+    return inst.slope, inst.y_intercept
+
+
+recursive = {'no refresh': None, 'refresh': 7}
+
+
+# Test RecursiveLeastSquares.append() and RecursiveLeastSquares.remove()
+@pytest.mark.parametrize('refresh', list(recursive.values()),
+                         ids=list(recursive.keys()))
+def test__recursiveleastsquares_sliding(refresh):
+    rng = np.random.RandomState(5)
+    points = [(x, 3 * x - 2 + rng.standard_normal())
+              for x in rng.uniform(0, 10, 60)]
+    inst = regression.RecursiveLeastSquares(refresh=refresh)
+    for n, point in enumerate(points):
+        inst.append(*point)
+        if n >= 10:
+            inst.remove(*points[n - 10])
+        if n:
+            window = points[max(0, n - 9):n + 1]
+            assert (inst.slope, inst.y_intercept) == \
+                pytest.approx(exact_fit(window))
+    assert inst.statistics.count == 10
+
+
+def test__recursiveleastsquares_edges():
+    inst = regression.RecursiveLeastSquares(refresh=3)
+    inst.append(1.0, 2.0)
+    assert (inst.slope, inst.y_intercept) == (0, 2.0)
+    assert np.isnan(inst.r)
+    inst.append(2.0, 4.0)
+    assert inst.r == pytest.approx(1.0)
+    inst.remove()
+    assert inst.updates == 0
+    assert list(inst.points) == [(2.0, 4.0)]
+    inst.remove()
+    assert inst.slope is None and inst.statistics.count == 0
+
+
+def test__recursiveleastsquares_constant_after_removal():
+    points = ([(1000.0 * x, float(x)) for x in range(10)]
+              + [(5.0, float(x)) for x in range(10)])
+    inst = regression.RecursiveLeastSquares()
+    for n, point in enumerate(points):
+        inst.append(*point)
+        if n >= 10:
+            inst.remove(*points[n - 10])
+    assert inst.statistics.sxx != 0
+    assert inst.slope == 0
+    assert np.isnan(inst.r)
+
+
+recursive_remove = {
+    'not_retained': (None, (), 'x and y are required'),
+    'not_oldest': (5, (2.0, 4.0), 'is not the oldest retained point'),
+}
+
+
+@pytest.mark.parametrize('refresh, point, message',
+                         list(recursive_remove.values()),
+                         ids=list(recursive_remove.keys()))
+def test__recursiveleastsquares_remove_error(refresh, point, message):
+    inst = regression.RecursiveLeastSquares(refresh=refresh)
+    inst.append(1.0, 2.0)
+    inst.append(2.0, 4.0)
+    with pytest.raises(ValueError, match=message):
+        inst.remove(*point)
+
+
+###############################################################################
+# Test BatchLeastSquares Class
+def expected_fits(x_series, y_series):
+    expected = []
+    for x_values, y_values in zip(x_series, y_series):
+        inst = regression.LeastSquares(x=x_values, y=y_values)
+        inst.calc_y_intercept()
+        expected.append((inst.slope, inst.y_intercept))
+    return np.array(expected)
+
+
+rng = np.random.RandomState(2)
+batch_x = rng.uniform(0, 5, (40, 12))
+batch_y = rng.uniform(-1, 1, (1, 12)) * batch_x + rng.standard_normal((40, 12))
+batch_x[3] = 2.0
+batch_y[4] = -1.0
+
+
+# Test BatchLeastSquares.fit()
+def test__batch_fit_2d():
+    inst = regression.BatchLeastSquares(x=batch_x, y=batch_y)
+    inst.fit()
+    expected = expected_fits(batch_x, batch_y)
+    assert np.allclose(inst.slope, expected[:, 0])
+    assert np.allclose(inst.y_intercept, expected[:, 1])
+    assert inst.slope[3] == 0 and inst.slope[4] == 0
+    assert np.isnan(inst.r[3])
+    assert np.isclose(inst.r[0], np.corrcoef(batch_x[0], batch_y[0])[1, 0])
+
+
+def test__batch_fit_ragged():
+    lengths = rng.randint(1, 9, 30)
+    offsets = np.r_[0, np.cumsum(lengths)[:-1]]
+    x_values = rng.uniform(0, 5, lengths.sum())
+    y_values = 2 * x_values + rng.standard_normal(lengths.sum())
+    inst = regression.BatchLeastSquares(x=x_values, y=y_values,
+                                        offsets=offsets)
+    inst.fit()
+    bounds = list(zip(offsets, offsets + lengths))
+    expected = expected_fits([x_values[a:b] for a, b in bounds],
+                             [y_values[a:b] for a, b in bounds])
+    assert np.allclose(inst.slope, expected[:, 0])
+    assert np.allclose(inst.y_intercept, expected[:, 1])
+
+
+###############################################################################
+# Test rolling_least_squares()
+def test__rolling_least_squares():
+    rng = np.random.RandomState(8)
+    x_values = np.cumsum(rng.uniform(0, 1, 300)) + 1e4
+    y_values = 0.5 * x_values + rng.standard_normal(300)
+    x_values[100:120] = x_values[100]
+    y_values[200:220] = 7.0
+    result = regression.rolling_least_squares(x_values, y_values, 15)
+    assert result.slope.shape == (286, )
+    for start in (0, 50, 201, 270):
+        inst = regression.LeastSquares(x=x_values[start:start + 15],
+                                       y=y_values[start:start + 15])
+        inst.calc_y_intercept()
+        assert result.slope[start] == pytest.approx(inst.slope, abs=1e-6)
+        assert result.y_intercept[start] == pytest.approx(inst.y_intercept)
+    assert result.slope[105] == 0 and np.isnan(result.r[105])
+    assert result.y_intercept[105] == pytest.approx(
+        y_values[105:120].mean())
+    assert result.slope[201] == 0
+    assert result.r[0] == pytest.approx(
+        np.corrcoef(x_values[:15], y_values[:15])[1, 0])
+
+
+rolling_long = {
+    'index': np.arange(10 ** 6, dtype=np.float64),
+    'timestamp': 1.6e9 + 60 * np.arange(10 ** 6, dtype=np.float64),
+}
+
+
+@pytest.mark.parametrize('x_values', list(rolling_long.values()),
+                         ids=list(rolling_long.keys()))
+def test__rolling_least_squares_long(x_values):
+    rng = np.random.RandomState(4)
+    y_values = 2 * x_values + rng.standard_normal(x_values.size)
+    result = regression.rolling_least_squares(x_values, y_values, 100)
+    assert not np.any(result.slope == 0)
+    for start in rng.randint(0, x_values.size - 100, 20):
+        inst = regression.LeastSquares(x=x_values[start:start + 100],
+                                       y=y_values[start:start + 100])
+        inst.fit()
+        assert result.slope[start] == pytest.approx(inst.slope, rel=1e-9)
+        middle = inst.x.mean()
+        assert (result.slope[start] * middle + result.y_intercept[start]
+                == pytest.approx(inst.slope * middle + inst.y_intercept))
+
+
+def test__rolling_least_squares_short():
+    result = regression.rolling_least_squares([1, 2], [3, 4], 3)
+    assert result.slope.size == 0
+
+
+###############################################################################
+# Test bootstrap()
+boot_rng = np.random.RandomState(9)
+boot_x = boot_rng.uniform(0, 10, 400)
+boot_y = 1.5 * boot_x + 4 + boot_rng.standard_normal(400)
+
+
+def test__bootstrap():
+    result = regression.bootstrap(boot_x, boot_y, resamples=2000, seed=1)
+    slope, intercept = np.polyfit(boot_x, boot_y, 1)
+    assert result.slope[0] < slope < result.slope[1]
+    assert result.y_intercept[0] < intercept < result.y_intercept[1]
+    from scipy import stats
+
+    standard_error = stats.linregress(boot_x, boot_y).stderr
+    width = result.slope[1] - result.slope[0]
+    assert width == pytest.approx(2 * 1.96 * standard_error, rel=0.2)
+
+
+def test__bootstrap_reproducible():
+    serial = regression.bootstrap(boot_x, boot_y, resamples=300,
+                                  batch_size=64, seed=4)
+    parallel = regression.bootstrap(boot_x, boot_y, resamples=300,
+                                    batch_size=64, processes=2, seed=4)
+    assert serial == parallel
+    assert serial != regression.bootstrap(boot_x, boot_y, resamples=300,
+                                          batch_size=64, seed=5)
+
+
+# Test LeastSquares.confidence_intervals()
+def test__leastsquares_confidence_intervals():
+    inst = regression.LeastSquares(x=boot_x, y=boot_y)
+    result = inst.confidence_intervals(resamples=500, confidence=0.5, seed=2)
+    wide = inst.confidence_intervals(resamples=500, confidence=0.99, seed=2)
+    assert wide.slope[0] < result.slope[0] < result.slope[1] < wide.slope[1]
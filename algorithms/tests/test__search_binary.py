@@ -6,6 +6,8 @@
 .. moduleauthor:: Timothy Helton <timothy.j.helton@gmail.com>
 """
 
+import logging
+
 import pytest
 import testfixtures as tf
 
@@ -20,6 +22,7 @@ log_n = {
     'list': (list(range(8)), 3),
     'iter': (range(8), 3),
     'round_up': (range(100), 7),
+    'empty': ([], 0),
     'none': (None, None),
 }
 
@@ -53,6 +56,12 @@ def test__base_no_values():
     )
 
 
+def test__logger_handlers():
+    assert search.logger.level == logging.NOTSET
+    assert all(isinstance(x, logging.NullHandler)
+               for x in search.logger.handlers)
+
+
 #######################################
 # Test BinarySearch Class
 # Test BinarySearch.__repr__()
@@ -117,3 +126,96 @@ find_item = {
 def test__binary_find_item(kwargs, expected):
     inst = search.BinarySearch(**kwargs)
     assert inst.search()[0] == expected
+
+
+missing_item = {
+    'below': ({'item': 0, 'values': range(1, 10)}, 0),
+    'above': ({'item': 20, 'values': range(10)}, 10),
+    'between': ({'item': 12, 'values': range(5, 50, 5)}, 2),
+    'str': ({'item': 'cc', 'values': list('abcdefg')}, 3),
+    'single': ({'item': 2, 'values': [1]}, 1),
+    'power_of_two': ({'item': 1, 'values': [0, 2, 4, 6]}, 1),
+    'empty': ({'item': 1, 'values': []}, 0),
+}
+
+
+@pytest.mark.parametrize('kwargs, expected',
+                         list(missing_item.values()),
+                         ids=list(missing_item.keys()))
+def test__binary_find_missing_item(kwargs, expected):
+    inst = search.BinarySearch(**kwargs)
+    item_idx, steps, max_steps = inst.search()
+    assert item_idx is None
+    assert inst.insert_idx == expected
+    assert steps <= len(kwargs['values']).bit_length()
+
+
+def test__binary_search_repeat():
+    inst = search.BinarySearch(item=3, values=range(10))
+    inst.search()
+    inst.item = 8
+    assert inst.search()[0] == 8
+
+
+# Test BinarySearch.lower_bound() and BinarySearch.upper_bound()
+bounds = {
+    'list': ([1, 2, 2, 2, 5], 2, 1, 4),
+    'range': (range(0, 20, 2), 7, 4, 4),
+    'str': ('abbbc', 'b', 1, 4),
+    'tuple_missing': ((1, 3, 5), 6, 3, 3),
+}
+
+
+@pytest.mark.parametrize('values, item, lower, upper',
+                         list(bounds.values()),
+                         ids=list(bounds.keys()))
+def test__binary_bounds(values, item, lower, upper):
+    inst = search.BinarySearch(item=item, values=values)
+    assert inst.lower_bound() == lower
+    assert inst.upper_bound() == upper
+
+
+def test__binary_bounds_steps():
+    inst = search.BinarySearch(values=range(100))
+    inst.lower_bound(42)
+    assert 0 < inst.steps <= len(inst.values).bit_length()
+
+
+# Test BinarySearch.search_many()
+search_many = {
+    'ints': ({'values': range(5, 50, 5)}, [15, 45, 5, 12],
+             [2, 8, 0, -1], [True, True, True, False]),
+    'str': ({'values': list('abcdefg')}, ['c', 'g', 'z'],
+            [2, 6, -1], [True, True, False]),
+    'below': ({'values': [1, 2, 3]}, [0], [-1], [False]),
+    'empty': ({'values': []}, [1, 2], [-1, -1], [False, False]),
+}
+
+
+@pytest.mark.parametrize('kwargs, items, expected_idx, expected_found',
+                         list(search_many.values()),
+                         ids=list(search_many.keys()))
+def test__binary_search_many(kwargs, items, expected_idx, expected_found):
+    inst = search.BinarySearch(**kwargs)
+    result = inst.search_many(items)
+    assert result.item_idx.tolist() == expected_idx
+    assert result.found.tolist() == expected_found
+
+
+def test__binary_search_many_matches_search():
+    values = list(range(0, 300, 3))
+    result = search.BinarySearch(values=values).search_many(values)
+    for item, idx, steps in zip(values, result.item_idx, result.steps):
+        expected = search.BinarySearch(item=item, values=values).search()
+        assert (idx, steps, result.max_steps) == expected
+
+
+def test__binary_search_many_logger():
+    with tf.LogCapture() as log:
+        search.BinarySearch().search_many([1])
+    log.check(
+        ('algorithms.search', 'WARNING',
+         'The values argument was not provided.'),
+        ('algorithms.search', 'ERROR',
+         'The argument "values" must be defined for this method.'),
+    )
@@ -0,0 +1,105 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Eytzinger Search Test Module
+
+.. moduleauthor:: Timothy Helton <timothy.j.helton@gmail.com>
+"""
+
+import numpy as np
+import pytest
+import testfixtures as tf
+
+from algorithms import search
+
+
+#######################################
+# Test EytzingerSearch Class
+# Test EytzingerSearch.build()
+build = {
+    'complete': (range(7), [3, 1, 5, 0, 2, 4, 6]),
+    'partial': (range(10), [6, 3, 8, 1, 5, 7, 9, 0, 2, 4]),
+    'single': (range(1), [0]),
+}
+
+
+@pytest.mark.parametrize('values, expected',
+                         list(build.values()),
+                         ids=list(build.keys()))
+def test__eytzinger_build(values, expected):
+    inst = search.EytzingerSearch(values=values)
+    assert inst.layout[1:].tolist() == expected
+    assert inst.order[0] == len(values)
+
+
+# Test EytzingerSearch.search()
+eytzinger = {
+    'first': ({'item': 0, 'values': range(0, 100, 2)}, 0),
+    'middle': ({'item': 42, 'values': range(0, 100, 2)}, 21),
+    'last': ({'item': 98, 'values': range(0, 100, 2)}, 49),
+    'missing': ({'item': 43, 'values': range(0, 100, 2)}, None),
+    'duplicate': ({'item': 2, 'values': [1, 2, 2, 2, 3]}, 1),
+}
+
+
+@pytest.mark.parametrize('kwargs, expected',
+                         list(eytzinger.values()),
+                         ids=list(eytzinger.keys()))
+def test__eytzinger_search(kwargs, expected):
+    inst = search.EytzingerSearch(**kwargs)
+    item_idx, steps, max_steps = inst.search()
+    assert item_idx == expected
+    assert steps <= max_steps + 1
+
+
+insert_idx = {
+    'below': (-5, 0),
+    'between': (43, 22),
+    'above': (500, 50),
+}
+
+
+@pytest.mark.parametrize('item, expected',
+                         list(insert_idx.values()),
+                         ids=list(insert_idx.keys()))
+def test__eytzinger_search_insert_idx(item, expected):
+    inst = search.EytzingerSearch(item=item, values=range(0, 100, 2))
+    inst.search()
+    assert inst.insert_idx == expected
+
+
+def test__eytzinger_search_new_values():
+    inst = search.EytzingerSearch(item=30, values=[1, 2, 3])
+    inst.search()
+    inst.values = [10, 20, 30, 40, 50, 60]
+    assert inst.search()[0] == 2
+    assert inst.search_many([60, 15]).item_idx.tolist() == [5, -1]
+
+
+def test__eytzinger_search_empty():
+    inst = search.EytzingerSearch(item=3, values=[])
+    assert inst.search() == (None, 0, 0)
+    assert inst.insert_idx == 0
+    assert inst.search_many([1, 2]).item_idx.tolist() == [-1, -1]
+
+
+# Test EytzingerSearch.search_many()
+def test__eytzinger_search_many():
+    values = np.unique(np.random.RandomState(0).randint(0, 10000, 3000))
+    items = np.arange(-1, 10002)
+    result = search.EytzingerSearch(values=values).search_many(items)
+    expected = np.searchsorted(values, items)
+    found = np.isin(items, values)
+    assert np.array_equal(result.found, found)
+    assert np.array_equal(result.item_idx[found], expected[found])
+    assert np.all(result.item_idx[~found] == -1)
+    assert result.steps.max() <= result.max_steps + 1
+
+
+def test__eytzinger_logger():
+    with tf.LogCapture() as log:
+        search.EytzingerSearch().search()
+    log.check(
+        ('algorithms.search', 'ERROR',
+         'The argument "values" must be defined for this method.'),
+    )
@@ -0,0 +1,83 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Learned Index Search Test Module
+
+.. moduleauthor:: Timothy Helton <timothy.j.helton@gmail.com>
+"""
+
+import numpy as np
+import pytest
+import testfixtures as tf
+
+from algorithms import search
+
+
+linear = np.arange(0, 40000, 4)
+squares = np.arange(2000) ** 2
+duplicates = np.repeat(np.arange(100), 7)
+
+
+#######################################
+# Test LearnedIndexSearch Class
+# Test LearnedIndexSearch.fit()
+def test__learned_fit_linear():
+    inst = search.LearnedIndexSearch(values=linear)
+    assert inst.errors.tolist() == [0]
+    assert inst.slopes[0] == pytest.approx(0.25)
+
+
+def test__learned_fit_segments():
+    single = search.LearnedIndexSearch(values=squares)
+    segments = search.LearnedIndexSearch(values=squares, segments=16)
+    assert segments.limits.tolist()[:2] == [[0, 125], [125, 250]]
+    assert segments.errors.max() * 10 < single.errors.max()
+
+
+# Test LearnedIndexSearch.search()
+def test__learned_search_linear_steps():
+    inst = search.LearnedIndexSearch(item=20000, values=linear)
+    item_idx, steps, max_steps = inst.search()
+    assert item_idx == 5000
+    assert steps < max_steps
+
+
+@pytest.mark.parametrize('values, segments',
+                         [(linear, 1), (squares, 1), (squares, 16),
+                          (duplicates, 3), (np.array([5.0]), 4)],
+                         ids=['linear', 'squares', 'segments', 'duplicates',
+                              'single'])
+def test__learned_search_matches_searchsorted(values, segments):
+    inst = search.LearnedIndexSearch(values=values, segments=segments)
+    items = np.unique(np.r_[values, values + 1, values - 1])
+    for item in items:
+        inst.item = item
+        item_idx = inst.search()[0]
+        expected = np.searchsorted(values, item)
+        if item in values:
+            assert item_idx == expected
+        else:
+            assert item_idx is None
+            assert inst.insert_idx == expected
+
+
+def test__learned_search_new_values():
+    inst = search.LearnedIndexSearch(item=500, values=range(10))
+    inst.values = range(0, 1000, 2)
+    assert inst.search()[0] == 250
+    assert inst.first_keys.tolist() == [0]
+
+
+def test__learned_search_empty():
+    inst = search.LearnedIndexSearch(item=3, values=[])
+    assert inst.search() == (None, 0, 0)
+    assert inst.insert_idx == 0
+
+
+def test__learned_logger():
+    with tf.LogCapture() as log:
+        search.LearnedIndexSearch().search()
+    log.check(
+        ('algorithms.search', 'ERROR',
+         'The argument "values" must be defined for this method.'),
+    )
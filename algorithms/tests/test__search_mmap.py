@@ -0,0 +1,111 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Memory Mapped Search Test Module
+
+.. moduleauthor:: Timothy Helton <timothy.j.helton@gmail.com>
+"""
+
+import numpy as np
+import pytest
+
+from algorithms import search
+
+
+keys = np.arange(0, 2000, 4, dtype='<i8')
+
+
+@pytest.fixture
+def raw_file(tmpdir):
+    path = str(tmpdir.join('records.bin'))
+    payloads = [f'row{x}'.encode() for x in range(keys.size)]
+    search.MemoryMappedSearch.write(path, keys, payloads, payload_width=8)
+    return path
+
+
+@pytest.fixture
+def npy_file(tmpdir):
+    path = str(tmpdir.join('keys.npy'))
+    np.save(path, keys)
+    return path
+
+
+#######################################
+# Test MemoryMappedSearch Class
+# Test MemoryMappedSearch.__repr__()
+def test__mmap_repr(npy_file):
+    inst = search.MemoryMappedSearch(npy_file, item=4)
+    assert inst.__repr__() == f'MemoryMappedSearch(path={npy_file}, item=4)'
+
+
+# Test MemoryMappedSearch.open()
+def test__mmap_open_zero_copy(raw_file):
+    inst = search.MemoryMappedSearch(raw_file, payload_width=8)
+    assert isinstance(inst.records, np.memmap)
+    assert np.shares_memory(inst.values, inst.records)
+
+
+# Test MemoryMappedSearch.search()
+mmap_search = {
+    'first': (0, 0),
+    'middle': (1000, 250),
+    'last': (1996, 499),
+    'missing': (1001, None),
+}
+
+
+@pytest.mark.parametrize('item, expected',
+                         list(mmap_search.values()),
+                         ids=list(mmap_search.keys()))
+def test__mmap_search_raw(raw_file, item, expected):
+    inst = search.MemoryMappedSearch(raw_file, payload_width=8, item=item)
+    assert inst.search()[0] == expected
+
+
+@pytest.mark.parametrize('item, expected',
+                         list(mmap_search.values()),
+                         ids=list(mmap_search.keys()))
+def test__mmap_search_npy(npy_file, item, expected):
+    inst = search.MemoryMappedSearch(npy_file, item=item)
+    assert inst.search()[0] == expected
+
+
+def test__mmap_search_many(raw_file):
+    inst = search.MemoryMappedSearch(raw_file, payload_width=8)
+    result = inst.search_many([8, 9, 1996])
+    assert result.item_idx.tolist() == [2, -1, 499]
+
+
+def test__mmap_search_empty(tmpdir):
+    path = str(tmpdir.join('empty.bin'))
+    search.MemoryMappedSearch.write(path, np.array([], dtype='<i8'))
+    inst = search.MemoryMappedSearch(path, item=4)
+    assert inst.search() == (None, 0, 0)
+    assert inst.search_many([4]).item_idx.tolist() == [-1]
+
+
+# Test MemoryMappedSearch.payload()
+payload = {
+    'found': (1000, b'row250\x00\x00'),
+    'missing': (1001, None),
+}
+
+
+@pytest.mark.parametrize('item, expected',
+                         list(payload.values()),
+                         ids=list(payload.keys()))
+def test__mmap_payload(raw_file, item, expected):
+    inst = search.MemoryMappedSearch(raw_file, payload_width=8, item=item)
+    inst.search()
+    assert inst.payload() == expected
+
+
+def test__mmap_payload_structured_npy(tmpdir):
+    path = str(tmpdir.join('records.npy'))
+    records = np.zeros(3, dtype=[('key', '<i8'), ('payload', 'S4')])
+    records['key'] = [1, 5, 9]
+    records['payload'] = [b'a', b'b', b'c']
+    np.save(path, records)
+    inst = search.MemoryMappedSearch(path, item=5)
+    inst.search()
+    assert inst.payload() == b'b'
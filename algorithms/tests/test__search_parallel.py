@@ -0,0 +1,75 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Parallel Binary Search Test Module
+
+.. moduleauthor:: Timothy Helton <timothy.j.helton@gmail.com>
+"""
+
+from decimal import Decimal
+
+import numpy as np
+import pytest
+import testfixtures as tf
+
+from algorithms import search
+
+
+values = np.arange(0, 30000, 3)
+
+
+#######################################
+# Test ParallelBinarySearch Class
+# Test ParallelBinarySearch.search_many()
+parallel = {
+    'ints': (values, np.random.RandomState(0).randint(-5, 30005, 5000)),
+    'str': (list('abcdefg'), list('gfedcbaz')),
+    'empty': (values, np.array([], dtype=int)),
+}
+
+
+@pytest.mark.parametrize('values, items',
+                         list(parallel.values()),
+                         ids=list(parallel.keys()))
+def test__parallel_search_many(values, items):
+    expected = search.BinarySearch(values=values).search_many(items)
+    with search.ParallelBinarySearch(values=values, processes=2) as inst:
+        result = inst.search_many(items)
+    assert np.array_equal(result.item_idx, expected.item_idx)
+    assert np.array_equal(result.steps, expected.steps)
+    assert np.array_equal(result.found, expected.found)
+    assert result.max_steps == expected.max_steps
+
+
+def test__parallel_search_many_reuse():
+    with search.ParallelBinarySearch(values=values, processes=2) as inst:
+        inst.search_many([3, 6])
+        pool = inst.pool
+        assert inst.search_many([9]).item_idx.tolist() == [3]
+        assert inst.pool is pool
+    assert inst.pool is None
+    assert inst.block is None
+
+
+def test__parallel_search_many_new_values():
+    with search.ParallelBinarySearch(values=values, processes=2) as inst:
+        inst.search_many([3])
+        pool = inst.pool
+        inst.values = np.arange(10) * 10
+        assert inst.search_many([30, 31]).item_idx.tolist() == [3, -1]
+        assert inst.pool is not pool
+
+
+def test__parallel_search_many_object_values():
+    objects = [Decimal(x) for x in range(5)]
+    items = [Decimal(3), Decimal(1)]
+    with tf.LogCapture() as log:
+        with search.ParallelBinarySearch(values=objects) as inst:
+            result = inst.search_many(items)
+    assert result.found.all()
+    assert inst.pool is None
+    log.check(
+        ('algorithms.search', 'WARNING',
+         'Values of object type can not be shared, the search will run in '
+         'this process.'),
+    )
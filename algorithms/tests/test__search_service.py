@@ -0,0 +1,99 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Search Service Test Module
+
+.. moduleauthor:: Timothy Helton <timothy.j.helton@gmail.com>
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+import testfixtures as tf
+
+from algorithms import search
+from algorithms import search_service
+
+
+values = np.arange(0, 3000, 3)
+
+
+def run_lookups(items, **kwargs):
+    async def main():
+        async with search_service.SearchService(values, **kwargs) as service:
+            results = await asyncio.gather(*[service.lookup(x)
+                                             for x in items])
+        return service, results
+    return asyncio.run(main())
+
+
+#######################################
+# Test SearchService Class
+# Test SearchService.__repr__()
+def test__service_repr():
+    inst = search_service.SearchService([1, 2], window=0.5, max_batch=4)
+    assert inst.__repr__() == ('SearchService(values=[1, 2], window=0.5, '
+                               'max_batch=4)')
+
+
+# Test SearchService.lookup()
+def test__service_lookup():
+    items = [0, 3, 1500, 1501, 2997]
+    service, results = run_lookups(items)
+    for item, result in zip(items, results):
+        expected = search.BinarySearch(item=item, values=values).search()
+        assert result == expected
+    assert service.batches == 1
+    assert list(service.batch_sizes) == [5]
+    assert service.max_queue_depth == 5
+
+
+max_batch = {
+    'split': (10, 4, [4, 4, 2]),
+    'single': (3, 10, [3]),
+}
+
+
+@pytest.mark.parametrize('lookups, size, expected',
+                         list(max_batch.values()),
+                         ids=list(max_batch.keys()))
+def test__service_max_batch(lookups, size, expected):
+    service, results = run_lookups(range(0, 3 * lookups, 3), max_batch=size)
+    assert [x[0] for x in results] == list(range(lookups))
+    assert list(service.batch_sizes) == expected
+    assert service.mean_batch_size == sum(expected) / len(expected)
+
+
+def test__service_bad_lookup():
+    async def main():
+        async with search_service.SearchService(values) as service:
+            return await asyncio.gather(
+                service.lookup(3), service.lookup('x'), service.lookup(6),
+                return_exceptions=True)
+    with tf.LogCapture('algorithms.search_service') as log:
+        results = asyncio.run(main())
+    assert results[0] == (1, 10, 10)
+    assert results[2][0] == 2
+    assert isinstance(results[1], TypeError)
+    assert [x.getMessage() for x in log.records] == [
+        "Search for 'x' failed."]
+
+
+def test__service_not_started():
+    async def main():
+        await search_service.SearchService(values).lookup(3)
+    with pytest.raises(RuntimeError):
+        asyncio.run(main())
+
+
+def test__service_stop_cancels_pending():
+    async def main():
+        service = search_service.SearchService(values, window=10)
+        await service.start()
+        pending = asyncio.ensure_future(service.lookup(3))
+        await asyncio.sleep(0)
+        await service.stop()
+        await asyncio.sleep(0)
+        return pending.cancelled()
+    assert asyncio.run(main())
@@ -0,0 +1,92 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Sharded Index Test Module
+
+.. moduleauthor:: Timothy Helton <timothy.j.helton@gmail.com>
+"""
+
+import os
+import os.path as osp
+
+import numpy as np
+import pytest
+
+from algorithms import search
+
+
+@pytest.fixture
+def shards(tmpdir):
+    shard_keys = (np.arange(0, 1000, 2), np.arange(500, 1500, 5),
+                  np.array([], dtype='<i8'), np.array([7, 7, 7, 7, 7, 8]))
+    paths = []
+    for n, keys in enumerate(shard_keys):
+        path = str(tmpdir.join(f'shard_{n}.bin'))
+        search.MemoryMappedSearch.write(path, keys.astype('<i8'))
+        paths.append(path)
+    return paths
+
+
+#######################################
+# Test ShardedIndex Class
+# Test ShardedIndex.build()
+def test__sharded_build(shards):
+    inst = search.ShardedIndex.build(shards, block_size=16)
+    assert all(osp.isfile(inst.fence_path(x)) for x in shards)
+    assert inst.limits[0] == (0, 998)
+    assert inst.limits[2] is None
+    assert inst.fences[0].tolist() == list(range(0, 1000, 32))
+
+
+def test__sharded_reopen(shards):
+    search.ShardedIndex.build(shards, block_size=16)
+    with np.load(search.ShardedIndex.fence_path(shards[0])) as saved:
+        fences = saved['fences']
+    fences[0] = -1
+    np.savez(search.ShardedIndex.fence_path(shards[0]), fences=fences,
+             block_size=16)
+    os.utime(shards[0], (0, 0))
+    inst = search.ShardedIndex(shards, block_size=16)
+    assert inst.fences[0][0] == -1
+
+
+def test__sharded_reopen_block_size(shards):
+    search.ShardedIndex.build(shards, block_size=16)
+    inst = search.ShardedIndex(shards, block_size=8)
+    assert inst.fences[0].tolist() == list(range(0, 1000, 16))
+
+
+# Test ShardedIndex.find()
+find = {
+    'one_shard': (4, [(0, 2)]),
+    'two_shards': (600, [(0, 300), (1, 20)]),
+    'duplicate': (7, [(3, 0)]),
+    'missing': (3, []),
+    'above': (5000, []),
+}
+
+
+@pytest.mark.parametrize('item, expected',
+                         list(find.values()),
+                         ids=list(find.keys()))
+def test__sharded_find(shards, item, expected):
+    inst = search.ShardedIndex(shards, block_size=16)
+    assert inst.find(item) == expected
+    assert inst.steps <= 5 * len(expected) + 5
+
+
+# Test ShardedIndex.range_scan()
+range_scan = {
+    'one_shard': ((10, 20), [(0, 5, 10)]),
+    'two_shards': ((990, 1010), [(0, 495, 500), (1, 98, 102)]),
+    'all': ((0, 2000), [(0, 0, 500), (1, 0, 200), (3, 0, 6)]),
+    'empty': ((3, 4), []),
+}
+
+
+@pytest.mark.parametrize('bounds, expected',
+                         list(range_scan.values()),
+                         ids=list(range_scan.keys()))
+def test__sharded_range_scan(shards, bounds, expected):
+    inst = search.ShardedIndex(shards, block_size=16)
+    assert inst.range_scan(*bounds) == expected
@@ -0,0 +1,118 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Sorted Index Test Module
+
+.. moduleauthor:: Timothy Helton <timothy.j.helton@gmail.com>
+"""
+
+import pytest
+import testfixtures as tf
+
+from algorithms import search
+
+
+values = [5, 1, 3, 3, 9, 7, 3]
+records = [('b', 2), ('a', 1), ('c', 3), ('a', 4)]
+
+
+#######################################
+# Test SortedIndex Class
+# Test SortedIndex.__repr__()
+def test__sorted_index_repr():
+    inst = search.SortedIndex(values=[3, 1, 2])
+    assert inst.__repr__() == 'SortedIndex(values=[1, 2, 3], unique=False)'
+
+
+# Test SortedIndex build
+build = {
+    'plain': ({'values': values}, [1, 3, 3, 3, 5, 7, 9]),
+    'unique': ({'values': values, 'unique': True}, [1, 3, 5, 7, 9]),
+    'key': ({'values': records, 'key': lambda x: x[0]}, list('aabc')),
+    'key_unique': ({'values': records, 'key': lambda x: x[0],
+                    'unique': True}, list('abc')),
+}
+
+
+@pytest.mark.parametrize('kwargs, expected',
+                         list(build.values()),
+                         ids=list(build.keys()))
+def test__sorted_index_build(kwargs, expected):
+    inst = search.SortedIndex(**kwargs)
+    assert inst.values == expected
+
+
+# Test SortedIndex.find()
+find = {
+    'first_duplicate': (3, 1),
+    'unique': (9, 6),
+    'missing': (4, None),
+}
+
+
+@pytest.mark.parametrize('item, expected',
+                         list(find.values()),
+                         ids=list(find.keys()))
+def test__sorted_index_find(item, expected):
+    inst = search.SortedIndex(values=values)
+    item_idx, steps, max_steps = inst.find(item)
+    assert item_idx == expected
+    assert 0 < steps <= max_steps + 1
+
+
+def test__sorted_index_find_key():
+    inst = search.SortedIndex(values=records, key=lambda x: x[0])
+    idx = inst.find('c')[0]
+    assert inst.records[idx] == ('c', 3)
+
+
+def test__sorted_index_find_empty():
+    inst = search.SortedIndex(values=[])
+    assert inst.find(3) == (None, 0, 0)
+    assert inst.insert_idx == 0
+
+
+# Test SortedIndex.range_scan()
+range_scan = {
+    'inner': ((3, 7), [3, 3, 3, 5]),
+    'all': ((0, 10), [1, 3, 3, 3, 5, 7, 9]),
+    'empty': ((4, 5), []),
+    'reversed': ((7, 3), []),
+}
+
+
+@pytest.mark.parametrize('bounds, expected',
+                         list(range_scan.values()),
+                         ids=list(range_scan.keys()))
+def test__sorted_index_range_scan(bounds, expected):
+    inst = search.SortedIndex(values=values)
+    assert inst.range_scan(*bounds) == expected
+
+
+# Test SortedIndex.rank() and SortedIndex.count()
+rank_count = {
+    'duplicate': (3, 1, 3),
+    'missing': (4, 4, 0),
+    'below': (0, 0, 0),
+    'above': (10, 7, 0),
+}
+
+
+@pytest.mark.parametrize('item, rank, count',
+                         list(rank_count.values()),
+                         ids=list(rank_count.keys()))
+def test__sorted_index_rank_count(item, rank, count):
+    inst = search.SortedIndex(values=values)
+    assert inst.rank(item) == rank
+    assert inst.count(item) == count
+
+
+def test__sorted_index_logger():
+    with tf.LogCapture() as log:
+        search.SortedIndex().rank(1)
+    log.check(
+        ('algorithms.search', 'WARNING',
+         'The values argument was not provided.'),
+        ('algorithms.search', 'ERROR',
+         'The argument "values" must be defined for this method.'),
+    )
@@ -0,0 +1,149 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Search Strategies Test Module
+
+.. moduleauthor:: Timothy Helton <timothy.j.helton@gmail.com>
+"""
+
+import datetime
+
+import numpy as np
+import pytest
+import testfixtures as tf
+
+from algorithms import search
+
+
+uniform = list(range(0, 3000, 3))
+minutes = np.datetime64('2024-01-01T00:00') + np.arange(0, 60000, 60)
+stamps = [datetime.datetime(2024, 1, 1) + datetime.timedelta(hours=x)
+          for x in range(500)]
+skewed = [x ** 3 for x in range(1000)]
+
+
+#######################################
+# Test InterpolationSearch Class
+# Test InterpolationSearch.search()
+interpolation = {
+    'uniform': ({'item': 1500, 'values': uniform}, 500),
+    'first': ({'item': 0, 'values': uniform}, 0),
+    'last': ({'item': 2997, 'values': uniform}, 999),
+    'skewed': ({'item': 729, 'values': skewed}, 9),
+    'missing': ({'item': 1501, 'values': uniform}, None),
+    'below': ({'item': -1, 'values': uniform}, None),
+    'constant': ({'item': 2, 'values': [2, 2, 2]}, 1),
+    'datetime64': ({'item': minutes[123], 'values': minutes}, 123),
+    'datetime': ({'item': stamps[321], 'values': stamps}, 321),
+}
+
+
+@pytest.mark.parametrize('kwargs, expected',
+                         list(interpolation.values()),
+                         ids=list(interpolation.keys()))
+def test__interpolation_search(kwargs, expected):
+    inst = search.InterpolationSearch(**kwargs)
+    item_idx, steps, max_steps = inst.search()
+    assert item_idx == expected
+    assert steps <= 2 * max_steps + 1
+
+
+def test__interpolation_search_uniform_steps():
+    inst = search.InterpolationSearch(item=1332, values=uniform)
+    assert inst.search() == (444, 1, 10)
+
+
+#######################################
+# Test ExponentialSearch Class
+# Test ExponentialSearch.search()
+exponential = {
+    'right': ({'item': 90, 'values': uniform, 'start': 20}, 30),
+    'left': ({'item': 30, 'values': uniform, 'start': 20}, 10),
+    'at_start': ({'item': 60, 'values': uniform, 'start': 20}, 20),
+    'end': ({'item': 2997, 'values': uniform}, 999),
+    'missing': ({'item': 31, 'values': uniform, 'start': 500}, None),
+    'str': ({'item': 'f', 'values': 'abcdefg'}, 5),
+}
+
+
+@pytest.mark.parametrize('kwargs, expected',
+                         list(exponential.values()),
+                         ids=list(exponential.keys()))
+def test__exponential_search(kwargs, expected):
+    inst = search.ExponentialSearch(**kwargs)
+    assert inst.search()[0] == expected
+
+
+def test__exponential_search_insert_idx():
+    inst = search.ExponentialSearch(item=31, values=uniform, start=500)
+    inst.search()
+    assert inst.insert_idx == 11
+
+
+def test__exponential_search_empty():
+    inst = search.ExponentialSearch(item=3, values=[], start=5)
+    assert inst.search() == (None, 0, 0)
+    assert inst.insert_idx == 0
+
+
+def test__exponential_search_matches_binary():
+    values = sorted(np.random.RandomState(0).randint(0, 500, 200).tolist())
+    for item in range(-1, 501):
+        found = search.ExponentialSearch(item=item, values=values,
+                                         start=100).search()[0]
+        if found is None:
+            assert item not in values
+        else:
+            assert found == values.index(item)
+
+
+#######################################
+# Test GallopingSearch Class
+# Test GallopingSearch.search()
+def test__galloping_search():
+    inst = search.GallopingSearch(values=uniform)
+    steps = []
+    for item in (1200, 1203, 1209, 1194):
+        inst.item = item
+        item_idx, step, max_steps = inst.search()
+        assert item_idx == item // 3
+        assert inst.start == item_idx
+        steps.append(step)
+    assert max(steps[1:]) < max_steps
+
+
+#######################################
+# Test AdaptiveSearch Class
+# Test AdaptiveSearch.select()
+select = {
+    'uniform': ({'values': uniform}, search.InterpolationSearch),
+    'skewed': ({'values': skewed}, search.BinarySearch),
+    'str': ({'values': 'abcdefg'}, search.BinarySearch),
+    'datetime64': ({'values': minutes}, search.InterpolationSearch),
+    'datetime': ({'values': stamps}, search.InterpolationSearch),
+    'start': ({'values': uniform, 'start': 5}, search.GallopingSearch),
+}
+
+
+@pytest.mark.parametrize('kwargs, expected',
+                         list(select.values()),
+                         ids=list(select.keys()))
+def test__adaptive_select(kwargs, expected):
+    inst = search.AdaptiveSearch(**kwargs)
+    assert type(inst.select()) is expected
+
+
+# Test AdaptiveSearch.search()
+def test__adaptive_search():
+    inst = search.AdaptiveSearch(item=1500, values=uniform)
+    assert inst.search() == inst.strategy.search()
+    assert inst.item_idx == 500
+
+
+def test__adaptive_search_logger():
+    with tf.LogCapture() as log:
+        search.AdaptiveSearch().search()
+    log.check(
+        ('algorithms.search', 'ERROR',
+         'The argument "values" must be defined for this method.'),
+    )
@@ -7,6 +7,7 @@
 """
 
 from collections import namedtuple
+import json
 
 import numpy as np
 import pytest
@@ -81,3 +82,452 @@ def test__calc_quartiles(kwargs, quartile_tuple, inner_quartile_range):
     inst.calc_quartiles()
     assert inst.quartiles == quartile_tuple
     assert inst.inner_quartile_range == inner_quartile_range
+
+
+@pytest.mark.parametrize('kwargs, quartile_tuple, inner_quartile_range',
+                         list(quartiles.values()),
+                         ids=list(quartiles.keys()))
+def test__calc_quartiles_selection(kwargs, quartile_tuple,
+                                   inner_quartile_range):
+    inst = stats.General(**kwargs)
+    inst.calc_quartiles(selection=True)
+    assert inst.quartiles == quartile_tuple
+    assert inst.inner_quartile_range == inner_quartile_range
+
+
+@pytest.mark.parametrize('length', range(2, 40))
+def test__calc_quartiles_selection_matches_sort(length):
+    data = np.random.RandomState(length).randint(0, 10, length)
+    expected = stats.General(data=data)
+    expected.calc_quartiles()
+    inst = stats.General(data=data)
+    inst.calc_quartiles(selection=True)
+    assert inst.quartiles == expected.quartiles
+    assert inst.inner_quartile_range == expected.inner_quartile_range
+
+
+@pytest.mark.parametrize('kwargs, median, low_array, high_array',
+                         list(calc_median.values()),
+                         ids=list(calc_median.keys()))
+def test__general_calc_median_selection(kwargs, median, low_array,
+                                        high_array):
+    inst = stats.General(**kwargs)
+    inst.calc_median(selection=True)
+    assert inst.median == median
+    if low_array is not None:
+        assert np.array_equal(np.sort(inst.median_low), np.r_[low_array])
+        assert np.array_equal(np.sort(inst.median_high), np.r_[high_array])
+
+
+# Test quartile_positions()
+quartile_positions = {
+    'odd': (7, ((1,), (3,), (5,))),
+    'even': (6, ((1,), (2, 3), (4,))),
+    'even_halves': (8, ((1, 2), (3, 4), (5, 6))),
+    'single': (1, ((), (0,), ())),
+}
+
+
+@pytest.mark.parametrize('length, expected',
+                         list(quartile_positions.values()),
+                         ids=list(quartile_positions.keys()))
+def test__quartile_positions(length, expected):
+    assert stats.quartile_positions(length) == expected
+
+
+# Test update()
+def test__general_update_exact():
+    data = np.random.RandomState(0).standard_normal(1000) * 3 + 7
+    inst = stats.General()
+    for chunk in np.array_split(data, 7):
+        inst.update(chunk)
+    expected = stats.General(data=data)
+    expected.calc_quartiles()
+    assert inst.count == 1000
+    assert inst.mean == pytest.approx(data.mean())
+    assert inst.variance == pytest.approx(data.var())
+    assert inst.quartiles == pytest.approx(expected.quartiles)
+    assert inst.inner_quartile_range == pytest.approx(
+        expected.inner_quartile_range)
+
+
+def test__general_update_bounded_memory():
+    rng = np.random.RandomState(1)
+    inst = stats.General(capacity=256)
+    for _ in range(50):
+        inst.update(rng.uniform(0, 1, 20000))
+    retained = sum(x.size for x in inst.summary.sketch.levels)
+    assert inst.count == 10 ** 6
+    assert retained < 2000
+    assert inst.mean == pytest.approx(0.5, abs=0.01)
+    assert inst.quartiles == pytest.approx((0.25, 0.5, 0.75), abs=0.02)
+
+
+def test__general_update_empty_chunk():
+    inst = stats.General()
+    inst.update([])
+    assert inst.count == 0
+    assert inst.mean is None
+
+
+#######################################
+# Test QuantileSketch Class
+# Test QuantileSketch.order_statistics()
+def test__quantile_sketch_exact():
+    inst = stats.QuantileSketch(capacity=64)
+    inst.update(np.arange(50)[::-1])
+    assert inst.order_statistics((0, 10, 49)) == {0: 0, 10: 10, 49: 49}
+
+
+def test__quantile_sketch_merge():
+    rng = np.random.RandomState(2)
+    data = rng.standard_normal(100000)
+    left = stats.QuantileSketch(capacity=200, seed=0)
+    right = stats.QuantileSketch(capacity=200, seed=1)
+    left.update(data[:60000])
+    right.update(data[60000:])
+    left.merge(right)
+    assert left.count == data.size
+    weights = sum(x.size * 2 ** n for n, x in enumerate(left.levels))
+    assert weights == data.size
+    assert left.quartiles().q2 == pytest.approx(np.median(data), abs=0.05)
+
+
+#######################################
+# Test Summary Class
+data = np.random.RandomState(3).standard_normal(3000)
+
+
+def expected_quartiles(values):
+    inst = stats.General(data=values)
+    inst.calc_quartiles()
+    return tuple(inst.quartiles)
+
+
+# Test Summary.merge()
+def test__summary_merge_associative():
+    parts = [stats.Summary.from_data(x, capacity=4096)
+             for x in np.array_split(data, 3)]
+    left = stats.Summary(capacity=4096)
+    left.merge(parts[0]).merge(parts[1]).merge(parts[2])
+    parts = [stats.Summary.from_data(x, capacity=4096)
+             for x in np.array_split(data, 3)]
+    right = parts[0].merge(parts[1].merge(parts[2]))
+    for result in (left.finalize(), right.finalize()):
+        assert result.count == data.size
+        assert result.mean == pytest.approx(data.mean())
+        assert result.variance == pytest.approx(data.var())
+        assert tuple(result.quartiles) == pytest.approx(
+            expected_quartiles(data))
+
+
+# Test Summary.finalize()
+def test__summary_finalize_empty():
+    result = stats.Summary().finalize()
+    assert result.count == 0
+    assert np.isnan(result.median)
+
+
+# Test Summary.to_dict() and Summary.from_dict()
+def test__summary_dict_round_trip():
+    inst = stats.Summary.from_data(data, capacity=64)
+    json_state = json.loads(json.dumps(inst.to_dict()))
+    result = stats.Summary.from_dict(json_state).finalize()
+    assert result == inst.finalize()
+
+
+# Test summarize()
+summarize = {
+    'array': (lambda tmpdir: data),
+    'npy': (lambda tmpdir: save_npy(tmpdir)),
+    'raw': (lambda tmpdir: save_raw(tmpdir)),
+}
+
+
+def save_npy(tmpdir):
+    path = str(tmpdir.join('data.npy'))
+    np.save(path, data)
+    return path
+
+
+def save_raw(tmpdir):
+    path = str(tmpdir.join('data.bin'))
+    data.tofile(path)
+    return path
+
+
+@pytest.mark.parametrize('source',
+                         list(summarize.values()),
+                         ids=list(summarize.keys()))
+def test__summarize(tmpdir, source):
+    result = stats.summarize(source(tmpdir), capacity=4096,
+                             chunk_size=500).finalize()
+    assert result.count == data.size
+    assert result.mean == pytest.approx(data.mean())
+    assert tuple(result.quartiles) == pytest.approx(
+        expected_quartiles(data))
+
+
+# Test parallel_summary()
+def test__parallel_summary_array():
+    result = stats.parallel_summary(data, processes=2,
+                                    capacity=4096).finalize()
+    assert result.count == data.size
+    assert result.variance == pytest.approx(data.var())
+    assert tuple(result.quartiles) == pytest.approx(
+        expected_quartiles(data))
+
+
+def test__parallel_summary_files(tmpdir):
+    paths = []
+    for n, part in enumerate(np.array_split(data, 3)):
+        paths.append(str(tmpdir.join(f'part_{n}.npy')))
+        np.save(paths[-1], part)
+    result = stats.parallel_summary(paths, processes=2,
+                                    capacity=4096).finalize()
+    assert result.count == data.size
+    assert result.median == pytest.approx(np.median(data))
+
+
+# Test General with an axis
+series = np.random.RandomState(4).randint(0, 20, (6, 11))
+
+
+@pytest.mark.parametrize('length', [1, 2, 7, 10, 11])
+@pytest.mark.parametrize('selection', [False, True])
+def test__general_axis_quartiles(length, selection):
+    data = series[:, :length]
+    inst = stats.General(data=data, axis=1)
+    inst.calc_quartiles(selection=selection)
+    for n, row in enumerate(data):
+        expected = stats.General(data=row)
+        expected.calc_quartiles(selection=True)
+        assert np.allclose(inst.quartiles.q1[n], expected.quartiles.q1,
+                           equal_nan=True)
+        assert inst.quartiles.q2[n] == expected.quartiles.q2
+        assert np.allclose(inst.inner_quartile_range[n],
+                           expected.inner_quartile_range, equal_nan=True)
+
+
+def test__general_axis_list():
+    inst = stats.General(data=[np.arange(5), np.arange(5) * 2], axis=1)
+    inst.calc_mean()
+    inst.calc_quartiles()
+    assert inst.mean.tolist() == [2, 4]
+    assert inst.quartiles.q1.tolist() == [0.5, 1]
+    assert inst.inner_quartile_range.tolist() == [3, 6]
+
+
+def test__general_axis_columns():
+    inst = stats.General(data=series, axis=0)
+    inst.calc_median()
+    assert np.array_equal(inst.median, np.median(series, axis=0))
+    assert inst.median_low.shape == (3, 11)
+    assert np.all(inst.median_low.max(axis=0)
+                  <= inst.median_high.min(axis=0))
+
+
+#######################################
+# Test OutOfCore Class
+out_of_core = {
+    'normal': np.random.RandomState(5).standard_normal(20001),
+    'integers': np.random.RandomState(6).randint(0, 50, 10000),
+    'constant': np.full(5000, 3.5),
+    'even': np.random.RandomState(7).exponential(size=8000),
+}
+
+
+@pytest.fixture(params=list(out_of_core.keys()))
+def out_of_core_file(request, tmpdir):
+    data = out_of_core[request.param]
+    path = str(tmpdir.join('data.npy'))
+    np.save(path, data)
+    return path, data
+
+
+# Test OutOfCore.calc_quartiles()
+def test__out_of_core_quartiles(out_of_core_file):
+    path, data = out_of_core_file
+    inst = stats.OutOfCore(path, memory_budget=2 ** 12, bins=16)
+    inst.calc_mean()
+    inst.calc_quartiles()
+    expected = stats.General(data=data)
+    expected.calc_quartiles()
+    assert inst.mean == pytest.approx(data.mean())
+    assert tuple(inst.quartiles) == pytest.approx(tuple(expected.quartiles))
+
+
+def test__out_of_core_median_raw(tmpdir):
+    data = np.random.RandomState(8).standard_normal(999).astype('<f4')
+    path = str(tmpdir.join('data.bin'))
+    data.tofile(path)
+    inst = stats.OutOfCore(path, dtype='<f4', memory_budget=2 ** 10)
+    inst.calc_median()
+    assert inst.median == np.median(data)
+
+
+def test__out_of_core_in_budget(tmpdir):
+    path = str(tmpdir.join('data.npy'))
+    np.save(path, np.arange(10.0))
+    inst = stats.OutOfCore(path)
+    inst.calc_quartiles()
+    assert inst.quartiles == (2, 4.5, 7)
+    assert inst.passes == 2
+
+
+def test__out_of_core_selection(tmpdir):
+    path = str(tmpdir.join('data.npy'))
+    np.save(path, np.arange(10.0))
+    inst = stats.OutOfCore(path)
+    inst.calc_quartiles(selection=True)
+    inst.calc_median(selection=True)
+    assert inst.quartiles == (2, 4.5, 7)
+    assert inst.median == 4.5
+
+
+def test__out_of_core_lazy(tmpdir):
+    path = str(tmpdir.join('data.npy'))
+    np.save(path, np.arange(10.0))
+    inst = stats.OutOfCore(path)
+    assert inst.quartiles == (2, 4.5, 7)
+    assert inst.inner_quartile_range == 5
+    assert inst.mean == 4.5
+    assert not isinstance(inst, stats.General)
+    for name in ('sorted_data', 'sorted_axis', 'update'):
+        assert not hasattr(inst, name)
+
+
+# Test General lazy properties
+def test__general_lazy_properties():
+    inst = stats.General(data=np.array([3, 7, 8, 5, 12, 14, 21, 15, 18, 14]))
+    assert inst.quartiles == Quartiles(7, 13, 15)
+    assert inst.inner_quartile_range == 8
+    assert inst.median == 13
+    assert inst.mean == 11.7
+
+
+def test__general_sorted_once(monkeypatch):
+    calls = []
+    sort = np.sort
+
+    def counted_sort(*args, **kwargs):
+        calls.append(1)
+        return sort(*args, **kwargs)
+
+    monkeypatch.setattr(stats.np, 'sort', counted_sort)
+    inst = stats.General(data=np.arange(9)[::-1])
+    inst.calc_median()
+    inst.calc_quartiles()
+    inst.calc_quartiles(selection=True)
+    assert inst.quartiles == Quartiles(1.5, 4, 6.5)
+    assert len(calls) == 1
+
+
+def test__general_data_unchanged():
+    data = np.array([2, 0, 1, 4, 3])
+    inst = stats.General(data=data)
+    inst.calc_quartiles()
+    assert inst.data is data
+    assert data.tolist() == [2, 0, 1, 4, 3]
+
+
+def test__general_invalidation():
+    inst = stats.General(data=np.arange(5))
+    assert inst.median == 2
+    inst.data = np.arange(7)
+    assert inst.sorted_data.shape == (7,)
+    assert inst.median == 3
+    assert inst.quartiles == Quartiles(1, 3, 5)
+
+
+def test__general_no_data():
+    inst = stats.General()
+    assert inst.median is None
+    assert inst.sorted_data is None
+
+
+#######################################
+# Test Rolling Class
+def test__rolling_repr():
+    inst = stats.Rolling(data=np.arange(3), window=2)
+    assert inst.__repr__() == 'Rolling(data=[0 1 2], window=2)'
+
+
+@pytest.mark.parametrize('window', [1, 2, 5, 8, 50])
+def test__rolling_matches_general(window):
+    data = np.random.RandomState(9).randint(0, 30, 50)
+    inst = stats.Rolling(data=data, window=window)
+    inst.calc()
+    assert inst.mean.shape == (51 - window,)
+    for n in range(51 - window):
+        expected = stats.General(data=data[n:n + window])
+        assert inst.mean[n] == pytest.approx(expected.mean[0])
+        assert inst.median[n] == expected.median
+        if window > 1:
+            assert inst.q1[n] == expected.quartiles.q1
+            assert inst.q3[n] == expected.quartiles.q3
+            assert (inst.inner_quartile_range[n]
+                    == expected.inner_quartile_range)
+
+
+def test__rolling_many_blocks():
+    data = np.random.RandomState(10).standard_normal(3000)
+    inst = stats.Rolling(data=data, window=1000)
+    inst.calc_quartiles()
+    for n in range(0, 2001, 250):
+        expected = stats.General(data=data[n:n + 1000])
+        assert inst.median[n] == expected.median
+        assert inst.q1[n] == expected.quartiles.q1
+        assert inst.q3[n] == expected.quartiles.q3
+
+
+def test__rolling_nan():
+    data = np.arange(20.0)
+    data[10] = np.nan
+    inst = stats.Rolling(data=data, window=4)
+    inst.calc_quartiles()
+    assert np.isnan(inst.median[7:11]).all()
+    assert not np.isnan(inst.median[:7]).any()
+    assert inst.median[11:].tolist() == [12.5, 13.5, 14.5, 15.5, 16.5, 17.5]
+
+
+def test__rolling_short_series():
+    inst = stats.Rolling(data=np.arange(3), window=5)
+    inst.calc_quartiles()
+    assert inst.median.shape == (0,)
+
+
+#######################################
+# Test SortedBlocks Class
+def test__sorted_blocks_repr():
+    inst = stats.SortedBlocks([3, 1, 2], load=2)
+    assert inst.__repr__() == 'SortedBlocks(load=2, size=3)'
+
+
+# Test SortedBlocks.add(), SortedBlocks.remove() and SortedBlocks.select()
+def test__sorted_blocks_updates():
+    rng = np.random.RandomState(11)
+    values = rng.randint(0, 50, 40).tolist()
+    inst = stats.SortedBlocks(values, load=4)
+    for step in range(2000):
+        if values and (rng.rand() < 0.5 or len(values) > 80):
+            value = values.pop(rng.randint(len(values)))
+            inst.remove(value)
+        else:
+            value = int(rng.randint(0, 50))
+            values.append(value)
+            inst.add(value)
+        assert inst.select(range(len(values))) == sorted(values)
+        assert max(inst.lengths) <= 8
+    assert sum(inst.lengths) == len(values)
+
+
+def test__sorted_blocks_empty():
+    inst = stats.SortedBlocks([], load=4)
+    inst.add(5)
+    inst.add(3)
+    assert inst.select([0, 1]) == [3, 5]
+    inst.remove(3)
+    inst.remove(5)
+    inst.add(1)
+    assert inst.select([0]) == [1]
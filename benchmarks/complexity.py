@@ -0,0 +1,60 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Complexity Benchmark
+
+Estimate the empirical complexity of search.BinarySearch.search and
+stats.General.calc_quartiles with big_o.estimate.
+
+.. moduleauthor:: Timothy Helton <timothy.j.helton@gmail.com>
+"""
+
+import numpy as np
+
+from algorithms import big_o, search, stats
+
+
+def binary_search(size: int) -> search.BinarySearch:
+    """Binary search over a sorted data set.
+
+    :param int size: number of values
+    :returns: search instance looking for the last value
+    :rtype: BinarySearch
+    """
+    return search.BinarySearch(item=size - 1, values=list(range(size)))
+
+
+def random_data(size: int) -> np.ndarray:
+    """Random data set.
+
+    :param int size: number of values
+    :returns: standard normal values
+    :rtype: ndarray
+    """
+    return np.random.RandomState(0).standard_normal(size)
+
+
+def quartiles(data: np.ndarray) -> stats.Quartiles:
+    """Quartiles of a new General instance, so no cached view is reused.
+
+    :param ndarray data: data set
+    :returns: quartiles of the data set
+    :rtype: Quartiles
+    """
+    inst = stats.General(data=data)
+    inst.calc_quartiles()
+    return inst.quartiles
+
+
+if __name__ == '__main__':
+    checks = (
+        ('BinarySearch.search', lambda x: x.search(), binary_search,
+         ('O(1)', 'O(log n)'), 200),
+        ('General.calc_quartiles', quartiles, random_data,
+         ('O(1)', 'O(log n)', 'O(n)', 'O(n log n)'), 1),
+    )
+    for name, func, setup, allowed, number in checks:
+        result = big_o.estimate(func, setup=setup, number=number)
+        status = 'ok' if result.model in allowed else 'REGRESSION'
+        print(f'{name:<24}{result.model:<12}slope={result.slope:.3g} '
+              f'intercept={result.intercept:.3g} {status}')
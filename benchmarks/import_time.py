@@ -0,0 +1,68 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Package Import Time Benchmark
+
+Time a fresh interpreter importing the algorithms package and report the
+heavy third party modules loaded along the way.
+
+.. moduleauthor:: Timothy Helton <timothy.j.helton@gmail.com>
+"""
+
+import os.path as osp
+import statistics
+import subprocess
+import sys
+import time
+
+
+HEAVY_MODULES = ('matplotlib', 'pandas', 'scipy', 'seaborn')
+ROOT = osp.dirname(osp.dirname(osp.realpath(__file__)))
+STATEMENTS = {
+    'package': 'import algorithms',
+    'search, stats': ('import algorithms; algorithms.search; '
+                      'algorithms.stats'),
+    'all': ('import algorithms; algorithms.regression; algorithms.search; '
+            'algorithms.search_service; algorithms.stats'),
+}
+
+
+def loaded_modules(statement: str) -> list:
+    """Determine the heavy modules loaded by a statement.
+
+    :param str statement: Python statement run in a fresh interpreter
+    :returns: names of the heavy modules loaded
+    :rtype: list
+    """
+    check = (f'{statement}; import sys; '
+             f'print(" ".join(x for x in {HEAVY_MODULES!r} '
+             f'if x in sys.modules))')
+    output = subprocess.run([sys.executable, '-c', check], cwd=ROOT,
+                            stdout=subprocess.PIPE, check=True)
+    return output.stdout.decode().split()
+
+
+def import_time(statement: str, repeat: int = 5) -> float:
+    """Time a statement in fresh interpreters.
+
+    :param str statement: Python statement run in a fresh interpreter
+    :param int repeat: number of interpreters timed
+    :returns: median wall time in seconds
+    :rtype: float
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', statement], cwd=ROOT,
+                       check=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+if __name__ == '__main__':
+    baseline = import_time('pass')
+    print(f'{"import":<16}{"seconds":>10}  heavy modules')
+    for name, statement in STATEMENTS.items():
+        seconds = import_time(statement) - baseline
+        print(f'{name:<16}{seconds:>10.3f}  '
+              f'{" ".join(loaded_modules(statement)) or "-"}')
@@ -0,0 +1,49 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Quartile Benchmark
+
+Compare the sort based and selection based quartile calculations of
+stats.General.
+
+.. moduleauthor:: Timothy Helton <timothy.j.helton@gmail.com>
+"""
+
+import timeit
+
+import numpy as np
+
+from algorithms import stats
+
+
+SIZES = (10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+
+
+def quartile_time(data: np.ndarray, selection: bool, repeat: int = 3) \
+        -> float:
+    """Time the quartile calculation.
+
+    Every timing uses a new General instance, so the cached sorted copy of
+    an earlier timing is never reused.
+
+    :param ndarray data: data set
+    :param bool selection: if True partition the data instead of sorting
+    :param int repeat: number of timings
+    :returns: best time in seconds
+    :rtype: float
+    """
+    def quartiles():
+        stats.General(data=data).calc_quartiles(selection=selection)
+
+    return min(timeit.repeat(quartiles, number=1, repeat=repeat))
+
+
+if __name__ == '__main__':
+    rng = np.random.RandomState(0)
+    print(f'{"size":>10}{"sort (s)":>12}{"select (s)":>12}{"speedup":>10}')
+    for size in SIZES:
+        data = rng.standard_normal(size)
+        sort_time = quartile_time(data, selection=False)
+        select_time = quartile_time(data, selection=True)
+        print(f'{size:>10}{sort_time:>12.4f}{select_time:>12.4f}'
+              f'{sort_time / select_time:>10.1f}')